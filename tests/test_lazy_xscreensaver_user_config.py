@@ -0,0 +1,141 @@
+import os
+import tempfile
+import unittest
+from typing import Union
+
+from xscreensaver_config.multiline_parser.ProgramsParser import ProgramsParser
+
+from tux_control_plugin_xscreensaver.IsolatedConfigParser import IsolatedConfigParser
+from tux_control_plugin_xscreensaver.LazyXScreensaverUserConfig import LazyXScreensaverUserConfig
+
+
+def program_line(command: str, enabled: bool = True, renderer: str = '') -> str:
+    return '{}\\\n'.format(ProgramsParser().assemble([{'command': command, 'enabled': enabled, 'renderer': renderer}])[0])
+
+
+class TestLazyXScreensaverUserConfig(unittest.TestCase):
+    """
+    LazyXScreensaverUserConfig must read every file exactly as upstream ConfigParser does
+    """
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.config_path = os.path.join(self.temporary_directory.name, '.xscreensaver')
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def assert_same_as_config_parser(self, content: str) -> Union[dict, None]:
+        """
+        Compare both parsers on content, when ConfigParser fails lazy config must fail too
+        :param content:
+        :return: data read by ConfigParser, None when it failed
+        """
+        with open(self.config_path, 'w') as config_handle:
+            config_handle.write(content)
+
+        try:
+            expected = IsolatedConfigParser(self.config_path).read()
+        except Exception:
+            with self.assertRaises(Exception):
+                lazy_config = LazyXScreensaverUserConfig(self.config_path)
+                [lazy_config[key] for key in lazy_config]
+            return None
+
+        lazy_config = LazyXScreensaverUserConfig(self.config_path)
+        self.assertEqual(list(expected), list(lazy_config))
+        self.assertEqual(expected, {key: lazy_config[key] for key in lazy_config})
+        # Access in other order, multi-line value is parsed on first access only
+        self.assertEqual(expected.get('programs'), lazy_config.get('programs'))
+        self.assertEqual(len(expected), len(lazy_config))
+        return expected
+
+    def test_block_followed_by_blank_line(self):
+        data = self.assert_same_as_config_parser(
+            'timeout:\t0:10:00\n'
+            'programs:\t\t\\\n'
+            + program_line('attraction -root')
+            + program_line('bouboule -root', enabled=False)
+            + program_line('gears -root', renderer='GL')
+            + '\n\n'
+            'mode:\trandom\n'
+        )
+        self.assertEqual(3, len(data['programs']))
+
+    def test_block_at_end_of_file(self):
+        self.assert_same_as_config_parser(
+            'timeout:\t0:10:00\n'
+            'programs:\t\t\\\n'
+            + program_line('attraction -root')
+            + program_line('bouboule -root')
+        )
+
+    def test_block_at_end_of_file_without_newline(self):
+        self.assert_same_as_config_parser(
+            'programs:\t\t\\\n'
+            + program_line('attraction -root').rstrip('\n')
+        )
+
+    def test_key_right_after_block(self):
+        # Line terminating the block is dropped by ConfigParser
+        data = self.assert_same_as_config_parser(
+            'programs:\t\t\\\n'
+            + program_line('attraction -root')
+            + 'mode:\trandom\n'
+            'lock:\tFalse\n'
+        )
+        self.assertNotIn('mode', data)
+        self.assertEqual('False', data['lock'])
+
+    def test_comment_inside_block(self):
+        # Comment ends the block
+        data = self.assert_same_as_config_parser(
+            'programs:\t\t\\\n'
+            + program_line('attraction -root')
+            + '# comment \\\n'
+            'mode:\tone\n'
+        )
+        self.assertEqual(1, len(data['programs']))
+        self.assertEqual('one', data['mode'])
+
+    def test_program_after_comment_inside_block(self):
+        # Rest of the block is no longer part of it, ConfigParser fails on it
+        data = self.assert_same_as_config_parser(
+            'programs:\t\t\\\n'
+            + program_line('attraction -root')
+            + '# comment\n'
+            + program_line('bouboule -root')
+            + '\n'
+        )
+        self.assertIsNone(data)
+
+    def test_repeated_keys(self):
+        self.assert_same_as_config_parser(
+            'mode:\tone\n'
+            'mode:\trandom\n'
+            'programs:\t\t\\\n'
+            + program_line('attraction -root')
+            + '\n'
+            'programs:\tnone\n'
+            'lock:\tTrue\n'
+            'lock:\t\t\\\n'
+            + program_line('bouboule -root')
+            + '\n'
+            'selected:\t1\n'
+        )
+
+    def test_single_value_repeated_as_block(self):
+        self.assert_same_as_config_parser(
+            'programs:\tnone\n'
+            'programs:\t\t\\\n'
+            + program_line('attraction -root')
+            + program_line('bouboule -root')
+            + '\n'
+        )
+
+    def test_invalid_line(self):
+        self.assertIsNone(self.assert_same_as_config_parser('timeout:\t0:10:00\ninvalid line\n'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,223 @@
+import os
+import json
+import tempfile
+import unittest
+import importlib.util
+from unittest import mock
+
+import xmltodict
+from xscreensaver_config.multiline_parser.ProgramsParser import ProgramsParser
+
+tux_control_spec = importlib.util.find_spec('tux_control')
+if tux_control_spec:
+    from tux_control_plugin_xscreensaver.Plugin import Plugin
+    from tux_control_plugin_xscreensaver.PluginConfigItem import PluginConfigItem
+    from tux_control_plugin_xscreensaver.PluginConfigOptionFragment import PluginConfigOptionFragment
+    from tux_control_plugin_xscreensaver.XScreensaverConfigOptionResolver import XScreensaverConfigOptionResolver
+
+SCREENSAVER_XML = """<?xml version="1.0" encoding="ISO-8859-1"?>
+<screensaver name="testsaver" _label="Test saver">
+  <command arg="-root"/>
+  <hgroup>
+    <number id="delay" type="slider" arg="-delay %" _label="Frame rate" low="0" high="100000" default="20000" convert="invert"/>
+    <number id="speed" type="spinbutton" arg="-speed %" _label="Speed" low="0.1" high="4.0" default="1.0"/>
+  </hgroup>
+  <vgroup>
+    <select id="mode">
+      <option id="default" _label="Default"/>
+      <option id="fast" _label="Fast" arg-set="-mode fast"/>
+      <option id="slow" _label="Slow" arg-set="-mode slow"/>
+    </select>
+    <hgroup>
+      <boolean id="showfps" _label="Show frame rate" arg-set="-fps"/>
+      <boolean id="solid" _label="Solid" arg-unset="-wire"/>
+    </hgroup>
+  </vgroup>
+  <hgroup>
+    <number id="count" type="spinbutton" arg="-count %" _label="Count" low="1" high="50" default="5"/>
+  </hgroup>
+  <string id="text" _label="Text" arg="-text %"/>
+  <_description>Screensaver used by tests.</_description>
+</screensaver>
+"""
+
+USER_COMMANDS = [
+    None,
+    'testsaver -root',
+    'testsaver -root -delay 30000 -speed 2.5 -mode slow -fps -wire -count 7 -text hello',
+    'testsaver -root -mode fast -text "quoted"',
+]
+
+
+def old_serialization(plugin_config_item: 'PluginConfigItem', plugin_config_options: list) -> dict:
+    """
+    Item as it was serialized before fragments, options are PluginConfigOption objects serialized by to_dict
+    """
+    return PluginConfigOptionFragment.to_plain({
+        'name': plugin_config_item.name,
+        'key': plugin_config_item.key,
+        'description': plugin_config_item.description,
+        'is_deletable': plugin_config_item.is_deletable,
+        'is_editable': plugin_config_item.is_editable,
+        'plugin_config_options': [plugin_config_option.to_dict() for plugin_config_option in plugin_config_options],
+        'is_enabled': plugin_config_item.is_enabled,
+        'is_selected': plugin_config_item.is_selected
+    })
+
+
+@unittest.skipUnless(tux_control_spec, 'tux-control is not installed')
+class TestXScreensaverConfigOptionResolverValues(unittest.TestCase):
+
+    def setUp(self):
+        self.xscreensaver_config = xmltodict.parse(SCREENSAVER_XML, dict_constructor=dict)
+
+    def test_values_match_config_options(self):
+        for command in USER_COMMANDS:
+            with self.subTest(command=command):
+                xscreensaver_user_config = {'command': command} if command else None
+                xscreensaver_config_option_resolver = XScreensaverConfigOptionResolver(self.xscreensaver_config, xscreensaver_user_config)
+                self.assertEqual(
+                    [(option.key, option.value) for option in xscreensaver_config_option_resolver.get_config_options()],
+                    list(xscreensaver_config_option_resolver.get_config_option_values())
+                )
+
+    def test_values_of_user_command(self):
+        xscreensaver_config_option_resolver = XScreensaverConfigOptionResolver(self.xscreensaver_config, {'command': USER_COMMANDS[2]})
+        self.assertEqual(
+            [
+                ('delay', 70000),
+                ('speed', 2.5),
+                # xmltodict merges repeated hgroup elements into list at position of the first one
+                ('count', 7),
+                ('mode', 'slow'),
+                ('showfps', True),
+                ('solid', False),
+                ('text', 'hello')
+            ],
+            list(xscreensaver_config_option_resolver.get_config_option_values())
+        )
+
+
+@unittest.skipUnless(tux_control_spec, 'tux-control is not installed')
+class TestPluginConfigItem(unittest.TestCase):
+
+    def setUp(self):
+        self.xscreensaver_config = xmltodict.parse(SCREENSAVER_XML, dict_constructor=dict)
+
+    def create_items(self, command: str):
+        xscreensaver_config_option_resolver = XScreensaverConfigOptionResolver(self.xscreensaver_config, {'command': command})
+        plugin_config_options = list(xscreensaver_config_option_resolver.get_config_options())
+        plugin_config_option_fragments = [
+            PluginConfigOptionFragment.from_plugin_config_option(plugin_config_option)
+            for plugin_config_option in plugin_config_options
+        ]
+        item_arguments = {
+            'name': 'Test saver',
+            'key': 'testsaver',
+            'description': 'Screensaver "used" by tests.',
+            'is_enabled': True,
+            'is_selected': False
+        }
+        plain_item = PluginConfigItem(plugin_config_options=plugin_config_options, **item_arguments)
+        item_with_fragments = PluginConfigItem(
+            plugin_config_options=plugin_config_options,
+            plugin_config_option_fragments=plugin_config_option_fragments,
+            **item_arguments
+        )
+        item_with_values = PluginConfigItem(
+            plugin_config_option_fragments=plugin_config_option_fragments,
+            plugin_config_option_values=[value for _, value in xscreensaver_config_option_resolver.get_config_option_values()],
+            plugin_config_options_factory=lambda: list(XScreensaverConfigOptionResolver(self.xscreensaver_config, {'command': command}).get_config_options()),
+            **item_arguments
+        )
+        return plugin_config_options, plain_item, item_with_fragments, item_with_values
+
+    def test_serialization_matches_option_serialization(self):
+        for command in USER_COMMANDS:
+            with self.subTest(command=command):
+                plugin_config_options, plain_item, item_with_fragments, item_with_values = self.create_items(command)
+                expected = old_serialization(plain_item, plugin_config_options)
+                for plugin_config_item in (plain_item, item_with_fragments, item_with_values):
+                    self.assertEqual(expected, PluginConfigOptionFragment.to_plain(plugin_config_item.to_dict()))
+                    self.assertEqual(expected, json.loads(plugin_config_item.to_json().decode('UTF-8')))
+
+                self.assertEqual(plain_item.to_json(), item_with_fragments.to_json())
+                self.assertEqual(plain_item.to_json(), item_with_values.to_json())
+
+    def test_options_are_built_on_access(self):
+        plugin_config_options, _, _, item_with_values = self.create_items(USER_COMMANDS[2])
+        item_with_values.to_json()
+        self.assertEqual(
+            [(option.key, option.value) for option in plugin_config_options],
+            [(option.key, option.value) for option in item_with_values.plugin_config_options]
+        )
+
+    def test_values_follow_replaced_options(self):
+        plugin_config_options, _, _, item_with_values = self.create_items(USER_COMMANDS[2])
+        item_with_values.plugin_config_options = plugin_config_options
+        plugin_config_options[0].value = 12345
+        self.assertEqual(12345, json.loads(item_with_values.to_json().decode('UTF-8'))['plugin_config_options'][0]['value'])
+
+
+@unittest.skipUnless(tux_control_spec, 'tux-control is not installed')
+class TestPluginFragmentFastPath(unittest.TestCase):
+    """
+    First fetch of item builds options and fragments, following fetches only resolve values, both must be equal
+    """
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.config_dir = os.path.join(self.temporary_directory.name, 'config')
+        self.home_directory = os.path.join(self.temporary_directory.name, 'home')
+        os.makedirs(self.config_dir)
+        os.makedirs(self.home_directory)
+        with open(os.path.join(self.config_dir, 'testsaver.xml'), 'w') as xml_handle:
+            xml_handle.write(SCREENSAVER_XML)
+
+        current_user = mock.Mock()
+        current_user.get_system_user.return_value.home_directory = self.home_directory
+        patches = [
+            mock.patch('tux_control_plugin_xscreensaver.Plugin.CurrentUser', current_user),
+            mock.patch('tux_control_plugin_xscreensaver.Plugin.Plugin._xscreensaver_config_dir', self.config_dir)
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def write_user_config(self, command: str) -> None:
+        programs_lines = ''.join(
+            '{}\\\n'.format(line)
+            for line in ProgramsParser().assemble([{'command': command, 'enabled': True, 'renderer': 'GL'}])
+        )
+        with open(os.path.join(self.home_directory, '.xscreensaver'), 'w') as config_handle:
+            config_handle.write('mode:\tone\nselected:\t0\nprograms:\t\t\\\n{}\n'.format(programs_lines))
+
+    def test_fast_path_matches_full_build(self):
+        for command in USER_COMMANDS[1:]:
+            with self.subTest(command=command):
+                self.write_user_config(command)
+                plugin = Plugin('xscreensaver', {'ALLOWED_SCREENSAVERS': []})
+                full_item = plugin.on_get_plugin_config_item('testsaver')
+                fast_item = plugin.on_get_plugin_config_item('testsaver')
+
+                self.assertIsNone(full_item.plugin_config_option_values)
+                self.assertIsNotNone(fast_item.plugin_config_option_values)
+                self.assertEqual(old_serialization(full_item, full_item.plugin_config_options), json.loads(fast_item.to_json().decode('UTF-8')))
+                self.assertEqual(full_item.to_json(), fast_item.to_json())
+                self.assertEqual(
+                    PluginConfigOptionFragment.to_plain(full_item.to_dict()),
+                    PluginConfigOptionFragment.to_plain(fast_item.to_dict())
+                )
+                self.assertEqual(
+                    [(option.key, option.value) for option in full_item.plugin_config_options],
+                    [(option.key, option.value) for option in fast_item.plugin_config_options]
+                )
+                self.assertTrue(fast_item.is_enabled)
+                self.assertTrue(fast_item.is_selected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import os
+import json
+import tempfile
+import unittest
+import importlib.util
+from unittest import mock
+
+from xscreensaver_config.multiline_parser.ProgramsParser import ProgramsParser
+
+tux_control_spec = importlib.util.find_spec('tux_control')
+if tux_control_spec:
+    from tux_control_plugin_xscreensaver.Plugin import Plugin
+
+SCREENSAVER_XML = """<?xml version="1.0" encoding="ISO-8859-1"?>
+<screensaver name="{name}" _label="{name}">
+  <command arg="-root"/>
+  <boolean id="showfps" _label="Show frame rate" arg-set="-fps"/>
+  <_description>Screensaver {name}.</_description>
+</screensaver>
+"""
+
+# Keys being prefixes of other keys, program entry belongs to every key its command starts with
+SCREENSAVER_NAMES = ['gears', 'gearsplus', 'glx', 'glxgears', 'attraction']
+
+
+@unittest.skipUnless(tux_control_spec, 'tux-control is not installed')
+class TestPluginDelta(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.config_dir = os.path.join(self.temporary_directory.name, 'config')
+        self.home_directory = os.path.join(self.temporary_directory.name, 'home')
+        os.makedirs(self.config_dir)
+        os.makedirs(self.home_directory)
+        for name in SCREENSAVER_NAMES:
+            with open(os.path.join(self.config_dir, '{}.xml'.format(name)), 'w') as xml_handle:
+                xml_handle.write(SCREENSAVER_XML.format(name=name))
+
+        current_user = mock.Mock()
+        current_user.get_system_user.return_value.home_directory = self.home_directory
+        patches = [
+            mock.patch('tux_control_plugin_xscreensaver.Plugin.CurrentUser', current_user),
+            mock.patch('tux_control_plugin_xscreensaver.Plugin.Plugin._xscreensaver_config_dir', self.config_dir)
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def write_user_config(self, commands: list, selected: int = 0) -> None:
+        programs_lines = ''.join(
+            '{}\\\n'.format(line)
+            for line in ProgramsParser().assemble([{'command': command, 'enabled': True, 'renderer': ''} for command in commands])
+        )
+        config_path = os.path.join(self.home_directory, '.xscreensaver')
+        with open(config_path, 'w') as config_handle:
+            config_handle.write('mode:\tone\nselected:\t{}\nprograms:\t\t\\\n{}\n'.format(selected, programs_lines))
+
+        # Tag is built from stat data, make sure rewrite within same clock tick is seen
+        stat = os.stat(config_path)
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+
+    def test_index_matches_find(self):
+        plugin = Plugin('xscreensaver', {'ALLOWED_SCREENSAVERS': []})
+        xscreensaver_user_config = {'programs': [
+            {'command': 'gearsplus -root'},
+            {'command': 'glxgears -root'},
+            {'command': 'gears -root -fps'},
+            {'command': None},
+            {'command': 'attraction -root'},
+            {'command': 'attraction -root -fps'},
+        ]}
+        item_keys = SCREENSAVER_NAMES + ['missing']
+        self.assertEqual(
+            {item_key: plugin._find_xscreensaver_user_config_item(item_key, xscreensaver_user_config) for item_key in item_keys},
+            plugin._index_xscreensaver_user_config_items(item_keys, xscreensaver_user_config)
+        )
+
+    def test_delta_reports_changed_items(self):
+        # Items without program entry have index 0, so selection moves between other entries only
+        self.write_user_config(['gears -root', 'glx -root', 'attraction -root'], selected=1)
+        plugin = Plugin('xscreensaver', {'ALLOWED_SCREENSAVERS': []})
+        version_tag, state = plugin.get_plugin_config_items_state()
+        self.assertEqual((version_tag, [], state), plugin.get_plugin_config_items_delta(version_tag, state))
+
+        self.write_user_config(['gears -root', 'glx -root -fps', 'attraction -root'], selected=2)
+        current_version_tag, changed_keys, current_state = plugin.get_plugin_config_items_delta(version_tag, state)
+        self.assertNotEqual(version_tag, current_version_tag)
+        self.assertEqual({'glx', 'attraction'}, set(changed_keys))
+
+        # Nothing changed since returned state
+        _, changed_keys, _ = plugin.get_plugin_config_items_delta(version_tag, current_state)
+        self.assertEqual([], changed_keys)
+
+    def test_state_is_kept_by_client(self):
+        self.write_user_config(['gears -root', 'glx -root'])
+        version_tag, state = Plugin('xscreensaver', {'ALLOWED_SCREENSAVERS': []}).get_plugin_config_items_state()
+
+        # Other worker answers delta with state sent back by client
+        self.write_user_config(['gears -root -fps', 'glx -root'])
+        _, changed_keys, _ = Plugin('xscreensaver', {'ALLOWED_SCREENSAVERS': []}).get_plugin_config_items_delta(
+            version_tag,
+            json.loads(json.dumps(state))
+        )
+        self.assertEqual(['gears'], changed_keys)
+
+    def test_unknown_state_needs_full_listing(self):
+        self.write_user_config(['gears -root'])
+        plugin = Plugin('xscreensaver', {'ALLOWED_SCREENSAVERS': []})
+        version_tag, state = plugin.get_plugin_config_items_state()
+        self.write_user_config(['gears -root -fps'])
+
+        self.assertIsNone(plugin.get_plugin_config_items_delta(version_tag, None)[1])
+        state['catalogue_fingerprint'] = 'other'
+        self.assertIsNone(plugin.get_plugin_config_items_delta(version_tag, state)[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+import importlib.util
+
+tux_control_spec = importlib.util.find_spec('tux_control')
+if tux_control_spec:
+    from tux_control_plugin_xscreensaver.XScreensaverRoundTripChecker import XScreensaverRoundTripChecker
+
+
+@unittest.skipUnless(tux_control_spec, 'tux-control is not installed')
+class TestXScreensaverRoundTripChecker(unittest.TestCase):
+
+    def setUp(self):
+        self.xscreensaver_round_trip_checker = XScreensaverRoundTripChecker(iterations=5)
+
+    def mismatch(self, screensaver: str, option: str, kind: str, sent: str) -> dict:
+        return {'screensaver': screensaver, 'option': option, 'kind': kind, 'sent': sent, 'received': None, 'command': None}
+
+    def test_mismatches_are_grouped_by_screensaver_option_and_kind(self):
+        mismatches = [
+            self.mismatch('a', 'text', 'changed', 'first'),
+            self.mismatch('a', 'text', 'changed', 'second'),
+            self.mismatch('a', 'text', 'missing', 'third'),
+            self.mismatch('b', 'text', 'changed', 'fourth'),
+            self.mismatch('b', None, 'error', 'fifth'),
+        ]
+        issues = self.xscreensaver_round_trip_checker.group_mismatches(mismatches)
+
+        self.assertEqual(
+            [('a', 'text', 'changed'), ('a', 'text', 'missing'), ('b', 'text', 'changed'), ('b', None, 'error')],
+            list(issues)
+        )
+        self.assertEqual(2, issues[('a', 'text', 'changed')]['count'])
+        self.assertEqual('first', issues[('a', 'text', 'changed')]['example']['sent'])
+
+    def test_baseline_round_trip(self):
+        issue_keys = {('b', None, 'error'), ('a', 'text', 'changed'), ('a', 'delay', 'missing')}
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            baseline_path = os.path.join(temporary_directory, 'known_issues.json')
+            self.xscreensaver_round_trip_checker.write_baseline(baseline_path, issue_keys)
+            self.assertEqual(issue_keys, self.xscreensaver_round_trip_checker.load_baseline(baseline_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
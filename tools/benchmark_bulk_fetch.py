@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Compare Plugin.on_get_plugin_config_items against the same number of Plugin.on_get_plugin_config_item calls.
+
+Runs against generated catalogue and temporary home directory, tux-control runtime is not needed.
+
+Usage: python3 tools/benchmark_bulk_fetch.py [--screensavers 200] [--keys 10] [--repeat 20]
+"""
+import time
+import argparse
+import tempfile
+
+from fake_runtime import fake_runtime, generate_catalogue
+from tux_control_plugin_xscreensaver.Plugin import Plugin
+
+
+def measure(func, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+
+    return (time.perf_counter() - started) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--screensavers', type=int, default=200)
+    parser.add_argument('--keys', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as config_dir, tempfile.TemporaryDirectory() as home_directory:
+        names = generate_catalogue(config_dir, args.screensavers)
+        keys = names[::max(len(names) // args.keys, 1)][:args.keys]
+
+        with fake_runtime(home_directory, config_dir):
+            plugin = Plugin('benchmark', {'ALLOWED_SCREENSAVERS': []})
+
+            # First call generates default ~/.xscreensaver
+            plugin.on_get_plugin_config_items(keys)
+
+            single = measure(lambda: [plugin.on_get_plugin_config_item(key) for key in keys], args.repeat)
+            bulk = measure(lambda: plugin.on_get_plugin_config_items(keys), args.repeat)
+
+    print('{} screensavers, {} keys, {} repeats'.format(args.screensavers, len(keys), args.repeat))
+    print('single fetches: {:8.2f} ms'.format(single * 1000))
+    print('bulk fetch:     {:8.2f} ms'.format(bulk * 1000))
+    print('speedup:        {:8.2f}x'.format(single / bulk))
+
+
+if __name__ == '__main__':
+    main()
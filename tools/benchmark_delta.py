@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Compare listing refresh by Plugin.get_plugin_config_items_delta against full Plugin.get_plugin_config_items_if_modified.
+
+User config is touched before every refresh, so both always see modified config. Runs against generated catalogue
+and temporary home directory, tux-control runtime is not needed.
+
+Usage: python3 tools/benchmark_delta.py [--screensavers 250] [--repeat 20]
+"""
+import os
+import time
+import argparse
+import tempfile
+
+from fake_runtime import fake_runtime, generate_catalogue
+from tux_control_plugin_xscreensaver.Plugin import Plugin
+
+
+def measure(func, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+
+    return (time.perf_counter() - started) / repeat
+
+
+def touch(path: str) -> None:
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--screensavers', type=int, default=250)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as config_dir, tempfile.TemporaryDirectory() as home_directory:
+        generate_catalogue(config_dir, args.screensavers)
+        user_config_path = os.path.join(home_directory, '.xscreensaver')
+
+        with fake_runtime(home_directory, config_dir):
+            plugin = Plugin('benchmark', {'ALLOWED_SCREENSAVERS': []})
+
+            # First listing generates default ~/.xscreensaver and fills caches
+            version_tag, state = plugin.get_plugin_config_items_state()
+            plugin.get_plugin_config_items_if_modified()
+
+            def full_refresh():
+                touch(user_config_path)
+                _, plugin_config_items = plugin.get_plugin_config_items_if_modified(version_tag)
+                [plugin_config_item.to_dict() for plugin_config_item in plugin_config_items]
+
+            def delta_refresh():
+                nonlocal version_tag, state
+                touch(user_config_path)
+                version_tag, changed_keys, state = plugin.get_plugin_config_items_delta(version_tag, state)
+                plugin.on_get_plugin_config_items(changed_keys)
+
+            full = measure(full_refresh, args.repeat)
+            delta = measure(delta_refresh, args.repeat)
+
+    print('{} screensavers, {} repeats'.format(args.screensavers, args.repeat))
+    print('full listing refresh: {:8.2f} ms'.format(full * 1000))
+    print('delta refresh:        {:8.2f} ms'.format(delta * 1000))
+    print('delta / full:         {:8.2f}x'.format(delta / full))
+
+
+if __name__ == '__main__':
+    main()
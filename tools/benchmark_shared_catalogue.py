@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Compare listing served from SHARED_CATALOGUE_PATH against listing served from in-process catalogue cache.
+
+Runs against generated catalogue and temporary home directory, tux-control runtime is not needed.
+
+Usage: python3 tools/benchmark_shared_catalogue.py [--screensavers 250] [--repeat 20]
+"""
+import os
+import time
+import argparse
+import tempfile
+
+from fake_runtime import fake_runtime, generate_catalogue
+from tux_control_plugin_xscreensaver.Plugin import Plugin
+
+
+def measure(func, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+
+    return (time.perf_counter() - started) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--screensavers', type=int, default=250)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as config_dir, tempfile.TemporaryDirectory() as home_directory:
+        generate_catalogue(config_dir, args.screensavers)
+
+        with fake_runtime(home_directory, config_dir):
+            cached_plugin = Plugin('benchmark', {'ALLOWED_SCREENSAVERS': []})
+            shared_plugin = Plugin('benchmark', {
+                'ALLOWED_SCREENSAVERS': [],
+                'SHARED_CATALOGUE_PATH': os.path.join(home_directory, 'catalogue.bin')
+            })
+
+            def listing(plugin: Plugin):
+                return lambda: [plugin_config_item.to_dict() for plugin_config_item in plugin.plugin_config_items]
+
+            # First listing generates default ~/.xscreensaver, publishes shared file and fills caches
+            listing(cached_plugin)()
+            listing(shared_plugin)()
+
+            cached = measure(listing(cached_plugin), args.repeat)
+            shared = measure(listing(shared_plugin), args.repeat)
+
+    print('{} screensavers, {} repeats'.format(args.screensavers, args.repeat))
+    print('process cache listing:   {:8.2f} ms'.format(cached * 1000))
+    print('shared catalogue listing: {:8.2f} ms'.format(shared * 1000))
+    print('shared / cached:          {:8.2f}x'.format(shared / cached))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Local stand-in for tux-control runtime used by benchmarks and load tests.
+
+Replaces CurrentUser with per-thread fake user and generates screensaver catalogue, so plugin can be driven without
+full tux-control deployment.
+"""
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+SCREENSAVER_XML = """<?xml version="1.0" encoding="ISO-8859-1"?>
+<screensaver name="{name}" _label="{name}">
+  <command arg="-root"/>
+  <number id="delay" type="slider" arg="-delay %" _label="Frame rate" low="0" high="100000" default="20000" convert="invert"/>
+  <number id="speed" type="slider" arg="-speed %" _label="Speed" low="0.1" high="4.0" default="1.0"/>
+  <select id="mode">
+    <option id="default" _label="Default"/>
+    <option id="fast" _label="Fast" arg-set="-mode fast"/>
+  </select>
+  <boolean id="showfps" _label="Show frame rate" arg-set="-fps"/>
+  <string id="text" _label="Text" arg="-text %"/>
+  <_description>Generated screensaver {name}.</_description>
+</screensaver>
+"""
+
+
+def generate_catalogue(config_dir: str, count: int) -> list:
+    names = ['saver{:04d}'.format(index) for index in range(count)]
+    for name in names:
+        with open(os.path.join(config_dir, '{}.xml'.format(name)), 'w') as xml_handle:
+            xml_handle.write(SCREENSAVER_XML.format(name=name))
+
+    return names
+
+
+class FakeSystemUser:
+    def __init__(self, home_directory: str):
+        self.home_directory = home_directory
+
+
+class FakeCurrentUser:
+    """
+    Current user is bound to thread, each simulated user runs in its own thread
+    """
+
+    def __init__(self, home_directory: str = None):
+        self._local = threading.local()
+        self.default_home_directory = home_directory
+
+    def login(self, home_directory: str) -> None:
+        os.makedirs(home_directory, exist_ok=True)
+        self._local.system_user = FakeSystemUser(home_directory)
+
+    def get_system_user(self) -> FakeSystemUser:
+        system_user = getattr(self._local, 'system_user', None)
+        if not system_user:
+            return FakeSystemUser(self.default_home_directory)
+
+        return system_user
+
+    def has_permission(self, permission: str) -> bool:
+        return True
+
+
+@contextmanager
+def fake_runtime(home_directory: str = None, config_dir: str = None):
+    """
+    Patch CurrentUser and catalogue directory used by plugin, plugin must be created inside of context
+    :param home_directory: home directory of threads that did not login
+    :param config_dir: catalogue directory
+    :return: FakeCurrentUser
+    """
+    fake_current_user = FakeCurrentUser(home_directory)
+    with mock.patch('tux_control_plugin_xscreensaver.Plugin.CurrentUser', fake_current_user):
+        if not config_dir:
+            yield fake_current_user
+            return
+
+        with mock.patch('tux_control_plugin_xscreensaver.Plugin.Plugin._xscreensaver_config_dir', config_dir):
+            yield fake_current_user
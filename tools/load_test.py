@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Load test of plugin entry points with many simulated users, tux-control runtime is replaced by local fakes.
+
+Each simulated user runs in its own thread with its own home directory, threads are spread over processes.
+Reports throughput and p50/p95/p99 latency per entry point.
+
+Usage: python3 tools/load_test.py [--screensavers 200] [--processes 2] [--threads 8] [--operations 50]
+                                  [--mix list=70,get=25,set=5] [--shared-catalogue] [--warm-up]
+"""
+import os
+import time
+import random
+import argparse
+import tempfile
+import traceback
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+
+from fake_runtime import fake_runtime, generate_catalogue
+from tux_control_plugin_xscreensaver.Plugin import Plugin
+
+
+def parse_mix(mix: str) -> dict:
+    operation_weights = {}
+    for part in mix.split(','):
+        operation, weight = part.split('=')
+        if operation not in ('list', 'get', 'set'):
+            raise argparse.ArgumentTypeError('Unknown operation {}'.format(operation))
+        operation_weights[operation] = int(weight)
+
+    return operation_weights
+
+
+def run_user(plugin: Plugin, fake_current_user, home_directory: str, item_keys: list, args) -> dict:
+    fake_current_user.login(home_directory)
+    random_generator = random.Random(home_directory)
+    operations = list(args.mix.keys())
+    weights = list(args.mix.values())
+    samples = {}
+    errors = {}
+    for _ in range(args.operations):
+        operation = random_generator.choices(operations, weights)[0]
+        item_key = random_generator.choice(item_keys)
+        if operation == 'list':
+            entry_point = 'plugin_config_items'
+            call = lambda: list(plugin.plugin_config_items)
+        elif operation == 'get':
+            entry_point = 'on_get_plugin_config_item'
+            call = lambda: plugin.on_get_plugin_config_item(item_key)
+        else:
+            entry_point = 'on_set_plugin_config_item'
+            # Value is fetched outside of measured call, same as UI does before save
+            plugin_config_item = plugin.on_get_plugin_config_item(item_key)
+            plugin_config_item.is_enabled = not plugin_config_item.is_enabled
+            call = lambda: plugin.on_set_plugin_config_item(plugin_config_item)
+
+        started = time.perf_counter()
+        try:
+            call()
+        except Exception:
+            errors.setdefault(entry_point, []).append(traceback.format_exc(limit=3))
+        samples.setdefault(entry_point, []).append(time.perf_counter() - started)
+
+    return {'samples': samples, 'errors': errors}
+
+
+def run_process(process_number: int, config_dir: str, homes_dir: str, item_keys: list, args) -> dict:
+    plugin_config = {
+        'ALLOWED_SCREENSAVERS': [],
+        'WARM_UP': args.warm_up,
+        'SHARED_CATALOGUE_PATH': os.path.join(homes_dir, 'catalogue.bin') if args.shared_catalogue else None
+    }
+    with fake_runtime(config_dir=config_dir) as fake_current_user:
+        plugin = Plugin('load_test', plugin_config)
+        home_directories = [
+            os.path.join(homes_dir, 'user-{}-{}'.format(process_number, thread_number))
+            for thread_number in range(args.threads)
+        ]
+        with ThreadPoolExecutor(max_workers=args.threads) as executor:
+            user_results = list(executor.map(
+                lambda home_directory: run_user(plugin, fake_current_user, home_directory, item_keys, args),
+                home_directories
+            ))
+
+    process_result = {'samples': {}, 'errors': {}}
+    for user_result in user_results:
+        for key in ('samples', 'errors'):
+            for entry_point, values in user_result[key].items():
+                process_result[key].setdefault(entry_point, []).extend(values)
+
+    return process_result
+
+
+def percentile(sorted_values: list, percent: float) -> float:
+    index = min(int(round(percent / 100 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--screensavers', type=int, default=200)
+    parser.add_argument('--processes', type=int, default=2)
+    parser.add_argument('--threads', type=int, default=8, help='Simulated users per process')
+    parser.add_argument('--operations', type=int, default=50, help='Operations per simulated user')
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix('list=70,get=25,set=5'))
+    parser.add_argument('--shared-catalogue', action='store_true', help='Use SHARED_CATALOGUE_PATH')
+    parser.add_argument('--warm-up', action='store_true', help='Use WARM_UP')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as config_dir, tempfile.TemporaryDirectory() as homes_dir:
+        item_keys = generate_catalogue(config_dir, args.screensavers)
+
+        started = time.perf_counter()
+        with multiprocessing.Pool(args.processes) as pool:
+            process_results = pool.starmap(
+                run_process,
+                [(process_number, config_dir, homes_dir, item_keys, args) for process_number in range(args.processes)]
+            )
+        elapsed = time.perf_counter() - started
+
+    samples = {}
+    errors = {}
+    for process_result in process_results:
+        for entry_point, values in process_result['samples'].items():
+            samples.setdefault(entry_point, []).extend(values)
+        for entry_point, values in process_result['errors'].items():
+            errors.setdefault(entry_point, []).extend(values)
+
+    print('{} screensavers, {} processes x {} users, {} operations each, {:.2f} s'.format(
+        args.screensavers, args.processes, args.threads, args.operations, elapsed
+    ))
+    print('{:<28} {:>7} {:>7} {:>9} {:>9} {:>9} {:>9}'.format('entry point', 'calls', 'errors', 'ops/s', 'p50 ms', 'p95 ms', 'p99 ms'))
+    for entry_point, values in sorted(samples.items()):
+        values.sort()
+        print('{:<28} {:>7} {:>7} {:>9.1f} {:>9.2f} {:>9.2f} {:>9.2f}'.format(
+            entry_point,
+            len(values),
+            len(errors.get(entry_point, [])),
+            len(values) / elapsed,
+            percentile(values, 50) * 1000,
+            percentile(values, 95) * 1000,
+            percentile(values, 99) * 1000
+        ))
+
+    for entry_point, entry_point_errors in sorted(errors.items()):
+        print('\nFirst error of {}:\n{}'.format(entry_point, entry_point_errors[0]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+import threading
+from typing import Callable, Union
+
+from tux_control_plugin_xscreensaver.XScreensaverCatalogue import XScreensaverCatalogue
+
+
+class CachedXScreensaverCatalogue:
+    """
+    In-process cache of parsed catalogue, rebuilt when catalogue fingerprint changes.
+    Concurrent callers wait for build in progress and share its result.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cache_key = None
+        self._config_dict = None
+
+    def get(self, xscreensaver_catalogue: XScreensaverCatalogue, is_cancelled: Callable[[], bool] = None) -> Union[dict, None]:
+        """
+        Returns parsed catalogue, None only when build was cancelled
+        :param xscreensaver_catalogue:
+        :param is_cancelled:
+        :return:
+        """
+        cache_key = (xscreensaver_catalogue.config_dir, xscreensaver_catalogue.get_fingerprint())
+        with self._lock:
+            if self._cache_key != cache_key:
+                config_dict = xscreensaver_catalogue.load(is_cancelled)
+                if config_dict is None:
+                    return None
+
+                self._config_dict = config_dict
+                self._cache_key = cache_key
+
+            return self._config_dict
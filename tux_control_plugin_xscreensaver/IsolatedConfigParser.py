@@ -0,0 +1,31 @@
+from typing import List
+from xscreensaver_config.ConfigParser import ConfigParser
+
+
+class IsolatedConfigParser(ConfigParser):
+    """
+    ConfigParser keeping parsed data per instance, upstream parser stores it in class attributes shared by all instances
+    """
+
+    def __init__(self, *args, config_lines: List[str] = None, **kwargs):
+        """
+        :param config_lines: already read content of config, config_path is then not opened
+        """
+        self.data = {}
+        self.multiline_parsers_by_key = {}
+        self._config_lines = config_lines
+        super().__init__(*args, **kwargs)
+
+    def _load(self):
+        if self._config_lines is None:
+            super()._load()
+            return
+
+        self._parse(self._config_lines)
+
+    def dumps(self) -> str:
+        """
+        Content that save() would write
+        :return:
+        """
+        return ''.join('{}\n'.format(line) for line in self._assemble())
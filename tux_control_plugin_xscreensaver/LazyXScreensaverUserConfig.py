@@ -0,0 +1,79 @@
+from collections.abc import Mapping
+from typing import Any, Iterator, List
+
+from xscreensaver_config.multiline_parser.IMultilineParser import IMultilineParser
+from xscreensaver_config.multiline_parser.ProgramsParser import ProgramsParser
+
+
+class LazyXScreensaverUserConfig(Mapping):
+    """
+    Read-only view of ~/.xscreensaver, file is read in one go and parsed on first access.
+    Multi-line values (programs) are only located by the scan and parsed when they are accessed.
+    Parsing rules follow xscreensaver_config.ConfigParser.
+    """
+
+    def __init__(self, config_path: str, multiline_parsers: List[IMultilineParser] = None):
+        self.config_path = config_path
+        self.multiline_parsers_by_key = {
+            multiline_parser.key_name: multiline_parser
+            for multiline_parser in (multiline_parsers if multiline_parsers else [ProgramsParser()])
+        }
+
+        with open(config_path, 'r') as config_handle:
+            self._lines = config_handle.read().splitlines()
+
+        self._data = None
+        self._multiline_lines = {}
+
+    def __getitem__(self, key: str) -> Any:
+        data = self._get_data()
+        multiline_lines = self._multiline_lines.get(key)
+        if multiline_lines is not None:
+            multiline_buffer = ''.join(line.rstrip().rstrip('\\') for line in multiline_lines)
+            found_parser = self.multiline_parsers_by_key.get(key)
+            data[key] = found_parser.parse(multiline_buffer) if found_parser else multiline_buffer
+            self._multiline_lines.pop(key, None)
+
+        return data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._get_data())
+
+    def __len__(self) -> int:
+        return len(self._get_data())
+
+    def _get_data(self) -> dict:
+        if self._data is None:
+            self._data = {}
+            self._scan()
+
+        return self._data
+
+    def _scan(self) -> None:
+        multiline_key = None
+        multiline_start = 0
+        for line_number, line in enumerate(self._lines):
+            stripped_line = line.strip()
+            if multiline_key is not None:
+                if stripped_line.endswith('\\') and not line.startswith('#'):
+                    continue
+
+                # Line terminating multi-line value is not part of it, same as in ConfigParser
+                self._multiline_lines[multiline_key] = self._lines[multiline_start:line_number]
+                multiline_key = None
+                continue
+
+            if not stripped_line or line.startswith('#'):
+                continue
+
+            try:
+                key, value = line.split(':', 1)
+            except ValueError:
+                raise Exception('Failed to parse line {}'.format(line))
+
+            key = key.strip(':')
+            self._data[key] = value.strip()
+            self._multiline_lines.pop(key, None)
+            if stripped_line.endswith('\\'):
+                multiline_key = key
+                multiline_start = line_number + 1
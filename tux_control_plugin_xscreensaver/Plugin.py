@@ -1,10 +1,10 @@
 import os
 import shutil
-import xmltodict
 import hashlib
-import datetime
-from pathlib import Path
-from typing import Union, Iterable, Tuple
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Union, Iterable, Tuple, Any, List, Callable
 from tux_control.plugin.IPlugin import IPlugin
 from tux_control.plugin.GridColumn import GridColumn
 from tux_control.plugin.IPluginConfigItem import IPluginConfigItem
@@ -27,7 +27,19 @@ from tux_control.plugin.exceptions import SetException
 from xscreensaver_config.ConfigParser import ConfigParser
 
 from tux_control_plugin_xscreensaver.PluginConfigItem import PluginConfigItem
+from tux_control_plugin_xscreensaver.IsolatedConfigParser import IsolatedConfigParser
+from tux_control_plugin_xscreensaver.XScreensaverTime import XScreensaverTime
+from tux_control_plugin_xscreensaver.XScreensaverProgram import XScreensaverProgram
 from tux_control_plugin_xscreensaver.XScreensaverConfigOptionResolver import XScreensaverConfigOptionResolver
+from tux_control_plugin_xscreensaver.XScreensaverCatalogue import XScreensaverCatalogue
+from tux_control_plugin_xscreensaver.SharedXScreensaverCatalogue import SharedXScreensaverCatalogue
+from tux_control_plugin_xscreensaver.CachedXScreensaverCatalogue import CachedXScreensaverCatalogue
+from tux_control_plugin_xscreensaver.PluginWarmUp import PluginWarmUp
+from tux_control_plugin_xscreensaver.PluginConfigOptionFragmentCache import PluginConfigOptionFragmentCache
+from tux_control_plugin_xscreensaver.PluginProfiler import PluginProfiler
+from tux_control_plugin_xscreensaver.XScreensaverPolicy import XScreensaverPolicy
+from tux_control_plugin_xscreensaver.XScreensaverPolicyApplier import XScreensaverPolicyApplier
+from tux_control_plugin_xscreensaver.LazyXScreensaverUserConfig import LazyXScreensaverUserConfig
 
 
 class Plugin(IPlugin):
@@ -47,9 +59,44 @@ class Plugin(IPlugin):
         GridColumn('is_selected', 'Selected', column_format='boolean'),
     ]
 
+    _profiled_entry_points = [
+        'on_get_plugin_config_item',
+        'on_get_plugin_config_items',
+        'on_set_plugin_config_item',
+        'get_plugin_config_items_if_modified',
+        'on_get_plugin_config_item_if_modified',
+        'get_plugin_config_items_state',
+        'get_plugin_config_items_delta',
+    ]
+
+    # User config values shown in global settings, used to detect their change
+    _global_settings_user_config_keys = [
+        'mode', 'timeout', 'cycle', 'lockTimeout', 'grabDesktopImages', 'grabVideoFrames', 'chooseRandomImages',
+        'imageDirectory', 'textMode', 'textLiteral', 'textFile', 'textProgram', 'textURL'
+    ]
+
     def __init__(self, plugin_key: str = None, plugin_config: dict = None) -> None:
         self.plugin_key = plugin_key
         self.plugin_config = plugin_config
+        self._shared_xscreensaver_catalogue = None
+        self._shared_xscreensaver_catalogue_lock = threading.Lock()
+        self._cached_xscreensaver_catalogue = CachedXScreensaverCatalogue()
+        self._plugin_config_option_fragment_cache = PluginConfigOptionFragmentCache()
+        self._global_settings_fragment_cache = PluginConfigOptionFragmentCache()
+
+        # Entry points are wrapped only when profiling is enabled, so there is no overhead otherwise
+        self._plugin_profiler = PluginProfiler.from_config(self._get_plugin_config_value('PROFILING'))
+        if self._plugin_profiler:
+            for entry_point in self._profiled_entry_points:
+                setattr(self, entry_point, self._plugin_profiler.wrap(entry_point, getattr(self, entry_point)))
+
+        self._plugin_warm_up = None
+        if self._get_plugin_config_value('WARM_UP'):
+            self._plugin_warm_up = PluginWarmUp([
+                self._get_xscreensaver_config,
+                self._warm_up_plugin_config_option_fragments,
+            ])
+            self._plugin_warm_up.start()
 
     @property
     def key(self) -> str:
@@ -61,23 +108,34 @@ class Plugin(IPlugin):
 
     @property
     def plugin_config_items(self) -> Iterable[IPluginConfigItem]:
+        plugin_config_items = self._iter_plugin_config_items()
+        if self._plugin_profiler:
+            return self._plugin_profiler.wrap_iterable('plugin_config_items', plugin_config_items)
+
+        return plugin_config_items
+
+    def _iter_plugin_config_items(self) -> Iterable[IPluginConfigItem]:
         # Global settings
-        allowed_screensavers = self.plugin_config.get('ALLOWED_SCREENSAVERS')
+        allowed_screensavers = self._get_plugin_config_value('ALLOWED_SCREENSAVERS')
         yield self._get_global_settings_plugin_config_item()
 
         # All xscrensavers
         xscreensaver_user_config = self._get_xscreensaver_user_config_dict()
-        for item_key, xscreensaver_config in self._get_xscreensaver_config().items():
-
-            if allowed_screensavers and item_key not in allowed_screensavers:
-                continue
-
-            xscreensaver_user_config_item_index, xscreensaver_user_config_item = self._find_xscreensaver_user_config_item(item_key, xscreensaver_user_config)
+        xscreensaver_catalogue = self._get_xscreensaver_config()
+        item_keys = [
+            item_key
+            for item_key in xscreensaver_catalogue
+            if not allowed_screensavers or item_key in allowed_screensavers
+        ]
+        xscreensaver_user_config_items = self._index_xscreensaver_user_config_items(item_keys, xscreensaver_user_config)
+        for item_key in item_keys:
+            xscreensaver_user_config_item_index, xscreensaver_user_config_item = xscreensaver_user_config_items[item_key]
             yield self._create_plugin_config_item(
                 item_key,
-                xscreensaver_config,
+                xscreensaver_catalogue[item_key],
                 xscreensaver_user_config_item,
-                self._is_xscreensaver_selected(xscreensaver_user_config, xscreensaver_user_config_item_index)
+                self._is_xscreensaver_selected(xscreensaver_user_config, xscreensaver_user_config_item_index),
+                xscreensaver_catalogue
             )
 
     def on_get_plugin_config_item(self, plugin_config_item_key: str) -> PluginConfigItem:
@@ -86,7 +144,8 @@ class Plugin(IPlugin):
             return self._get_global_settings_plugin_config_item()
 
         xscreensaver_user_config = self._get_xscreensaver_user_config_dict()
-        found_config = self._get_xscreensaver_config().get(plugin_config_item_key)
+        xscreensaver_catalogue = self._get_xscreensaver_config()
+        found_config = xscreensaver_catalogue.get(plugin_config_item_key)
         if not found_config:
             raise ValueError('Config not found')
 
@@ -95,9 +154,177 @@ class Plugin(IPlugin):
             plugin_config_item_key,
             found_config,
             xscreensaver_user_config_item,
-            self._is_xscreensaver_selected(xscreensaver_user_config, xscreensaver_user_config_item_index)
+            self._is_xscreensaver_selected(xscreensaver_user_config, xscreensaver_user_config_item_index),
+            xscreensaver_catalogue
+        )
+
+    def on_get_plugin_config_items(self, plugin_config_item_keys: Iterable[str]) -> List[dict]:
+        """
+        Resolve multiple items against one catalogue snapshot and one read of user config
+        :param plugin_config_item_keys:
+        :return: results in request order, {'key': ..., 'plugin_config_item': ..., 'error': ...}
+        """
+        plugin_config_item_keys = list(plugin_config_item_keys)
+        xscreensaver_user_config = self._get_xscreensaver_user_config_dict()
+        xscreensaver_config = self._get_xscreensaver_config()
+        xscreensaver_user_config_items = self._index_xscreensaver_user_config_items(
+            [key for key in plugin_config_item_keys if key != self._global_settings_key],
+            xscreensaver_user_config
         )
 
+        results = []
+        for plugin_config_item_key in plugin_config_item_keys:
+            result = {
+                'key': plugin_config_item_key,
+                'plugin_config_item': None,
+                'error': None
+            }
+            if plugin_config_item_key == self._global_settings_key:
+                result['plugin_config_item'] = self._get_global_settings_plugin_config_item(xscreensaver_user_config)
+            else:
+                found_config = xscreensaver_config.get(plugin_config_item_key)
+                if found_config:
+                    xscreensaver_user_config_item_index, xscreensaver_user_config_item = xscreensaver_user_config_items[plugin_config_item_key]
+                    result['plugin_config_item'] = self._create_plugin_config_item(
+                        plugin_config_item_key,
+                        found_config,
+                        xscreensaver_user_config_item,
+                        self._is_xscreensaver_selected(xscreensaver_user_config, xscreensaver_user_config_item_index),
+                        xscreensaver_config
+                    )
+                else:
+                    result['error'] = 'Config not found'
+
+            results.append(result)
+
+        return results
+
+    def get_plugin_config_items_if_modified(self, version_tag: str = None) -> Tuple[str, Union[List[IPluginConfigItem], None]]:
+        """
+        Returns current version tag and listing, listing is None when caller's version tag is still current
+        :param version_tag:
+        :return:
+        """
+        # Default config is generated first, otherwise first listing would be tagged as of missing config
+        self._ensure_xscreensaver_user_config()
+        # Tag is computed before listing is built, so concurrent change results in refetch, never in stale listing
+        current_version_tag = self.get_version_tag()
+        if version_tag == current_version_tag:
+            return current_version_tag, None
+
+        return current_version_tag, list(self.plugin_config_items)
+
+    def get_plugin_config_items_state(self) -> Tuple[str, dict]:
+        """
+        Returns current version tag and state of listing, client keeping it can refresh listing
+        by get_plugin_config_items_delta, state is computed before listing is fetched
+        :return:
+        """
+        self._ensure_xscreensaver_user_config()
+        catalogue_fingerprint = XScreensaverCatalogue(self._xscreensaver_config_dir).get_fingerprint()
+        return self._get_version_tag(catalogue_fingerprint), self._get_plugin_config_items_state(catalogue_fingerprint)
+
+    def get_plugin_config_items_delta(self, version_tag: str, state: dict) -> Tuple[str, Union[List[str], None], dict]:
+        """
+        Returns current version tag, keys of items changed since state (including added and removed ones)
+        and current state to be sent with next delta request, keys are None when full listing has to be fetched.
+        State is kept by client, so any worker can answer
+        :param version_tag: version tag returned together with state
+        :param state: state returned by get_plugin_config_items_state or previous delta
+        :return:
+        """
+        self._ensure_xscreensaver_user_config()
+        catalogue_fingerprint = XScreensaverCatalogue(self._xscreensaver_config_dir).get_fingerprint()
+        current_version_tag = self._get_version_tag(catalogue_fingerprint)
+        if version_tag == current_version_tag:
+            return current_version_tag, [], state
+
+        current_state = self._get_plugin_config_items_state(catalogue_fingerprint)
+        if not state or state.get('catalogue_fingerprint') != catalogue_fingerprint:
+            # Item states cover only user's config, any catalogue change may change every item
+            return current_version_tag, None, current_state
+
+        previous_item_states = state.get('item_states') or {}
+        item_states = current_state['item_states']
+        changed_keys = [item_key for item_key, item_state in item_states.items() if previous_item_states.get(item_key) != item_state]
+        changed_keys.extend(item_key for item_key in previous_item_states if item_key not in item_states)
+        return current_version_tag, changed_keys, current_state
+
+    def on_get_plugin_config_item_if_modified(self, plugin_config_item_key: str, version_tag: str = None) -> Tuple[str, Union[PluginConfigItem, None]]:
+        """
+        Returns current version tag and item, item is None when caller's version tag is still current
+        :param plugin_config_item_key:
+        :param version_tag:
+        :return:
+        """
+        self._ensure_xscreensaver_user_config()
+        current_version_tag = self.get_version_tag(plugin_config_item_key)
+        if version_tag == current_version_tag:
+            return current_version_tag, None
+
+        return current_version_tag, self.on_get_plugin_config_item(plugin_config_item_key)
+
+    def _get_plugin_config_items_state(self, catalogue_fingerprint: str) -> dict:
+        """
+        Hash of user state (program entry and selection) of every listed item, together with catalogue fingerprint
+        item states are valid for
+        :param catalogue_fingerprint:
+        :return:
+        """
+        allowed_screensavers = self._get_plugin_config_value('ALLOWED_SCREENSAVERS')
+        xscreensaver_user_config = self._get_xscreensaver_user_config_dict()
+        item_keys = [
+            item_key
+            for item_key in self._get_xscreensaver_config()
+            if not allowed_screensavers or item_key in allowed_screensavers
+        ]
+        xscreensaver_user_config_items = self._index_xscreensaver_user_config_items(item_keys, xscreensaver_user_config)
+
+        item_states = OrderedDict()
+        item_states[self._global_settings_key] = self._get_state_hash(
+            [xscreensaver_user_config.get(key) for key in self._global_settings_user_config_keys]
+        )
+        for item_key in item_keys:
+            xscreensaver_user_config_item_index, xscreensaver_user_config_item = xscreensaver_user_config_items[item_key]
+            item_states[item_key] = self._get_state_hash([
+                xscreensaver_user_config_item,
+                self._is_xscreensaver_selected(xscreensaver_user_config, xscreensaver_user_config_item_index)
+            ])
+
+        return {
+            'catalogue_fingerprint': catalogue_fingerprint,
+            'item_states': item_states
+        }
+
+    def _get_state_hash(self, state: list) -> str:
+        return hashlib.md5(repr(state).encode('UTF-8')).hexdigest()
+
+    def get_version_tag(self, plugin_config_item_key: str = None) -> str:
+        """
+        Cheap version tag of listing or single item, computed only from stat data and plugin config
+        :param plugin_config_item_key:
+        :return:
+        """
+        return self._get_version_tag(XScreensaverCatalogue(self._xscreensaver_config_dir).get_fingerprint(), plugin_config_item_key)
+
+    def _get_version_tag(self, catalogue_fingerprint: str, plugin_config_item_key: str = None) -> str:
+        try:
+            stat = os.stat(self._get_xscreensaver_user_config_path())
+            user_config_fingerprint = '{}:{}:{}'.format(stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        except FileNotFoundError:
+            user_config_fingerprint = 'missing'
+
+        version_tag = hashlib.md5()
+        for part in [
+            catalogue_fingerprint,
+            user_config_fingerprint,
+            ','.join(sorted(self._get_plugin_config_value('ALLOWED_SCREENSAVERS') or [])),
+            plugin_config_item_key or ''
+        ]:
+            version_tag.update('{};'.format(part).encode('UTF-8'))
+
+        return version_tag.hexdigest()
+
     def on_set_plugin_config_item(self, plugin_config_item: PluginConfigItem) -> None:
         values = plugin_config_item.get_values()
         xscreensaver_user_config = self._get_xscreensaver_user_config()
@@ -138,7 +365,7 @@ class Plugin(IPlugin):
             command = xscreensaver_config_option_resolver.get_command(values)
             new_programs_list = []
             for program in xscreensaver_user_config_dict.get('programs'):
-                if program.get('command').startswith(plugin_config_item.key):
+                if XScreensaverProgram.belongs_to(program, plugin_config_item.key):
                     program['command'] = command
                     program['enabled'] = plugin_config_item.is_enabled
 
@@ -157,16 +384,36 @@ class Plugin(IPlugin):
         except (FileNotFoundError, PermissionError) as e:
             raise SetException('Failed to save configuration: {}'.format(e)) from e
 
+    def apply_policy(self, home_directories: Iterable[str] = None, dry_run: bool = False, max_workers: int = 8) -> List[dict]:
+        """
+        Admin operation, applies ALLOWED_SCREENSAVERS and POLICY from plugin config to all users' configs
+        :param home_directories:
+        :param dry_run:
+        :param max_workers:
+        :return:
+        """
+        xscreensaver_policy = XScreensaverPolicy.from_plugin_config(self.plugin_config or {})
+        return XScreensaverPolicyApplier(xscreensaver_policy, max_workers).apply(home_directories, dry_run)
+
+    def cancel_warm_up(self) -> None:
+        """
+        Stop background warm-up started by WARM_UP config, requests build what is missing themselves
+        :return:
+        """
+        if self._plugin_warm_up:
+            self._plugin_warm_up.cancel()
+
     @property
     def _global_settings_key(self) -> str:
         return hashlib.md5(self.key.encode('UTF-8')).hexdigest()
 
-    def _is_xscreensaver_selected(self, xscreensaver_user_config: dict, xscreensaver_user_config_item_index: int):
+    def _is_xscreensaver_selected(self, xscreensaver_user_config: Mapping, xscreensaver_user_config_item_index: int):
         return int(xscreensaver_user_config.get('selected')) == xscreensaver_user_config_item_index
 
-    def _get_global_settings_plugin_config_item(self) -> PluginConfigItem:
-        xscreensaver_user_config = self._get_xscreensaver_user_config_dict()
-        return PluginConfigItem(
+    def _get_global_settings_plugin_config_item(self, xscreensaver_user_config: Mapping = None) -> PluginConfigItem:
+        if xscreensaver_user_config is None:
+            xscreensaver_user_config = self._get_xscreensaver_user_config_dict()
+        plugin_config_item = PluginConfigItem(
             name='Global Settings',
             key=self._global_settings_key,
             description='Global settings for all screensavers',
@@ -361,8 +608,54 @@ class Plugin(IPlugin):
             is_enabled=True
         )
 
-    def _create_plugin_config_item(self, item_key: str, xscreensaver_config: dict, xscreensaver_user_config: dict = None, is_selected: bool = False):
+        # Global settings do not depend on catalogue
+        plugin_config_item.plugin_config_option_fragments = self._global_settings_fragment_cache.get(
+            None,
+            plugin_config_item.key,
+            plugin_config_item.plugin_config_options
+        )
+        return plugin_config_item
+
+    def _create_plugin_config_item(self, item_key: str, xscreensaver_config: dict, xscreensaver_user_config: dict = None, is_selected: bool = False, xscreensaver_catalogue: Mapping = None):
         xscreensaver_config_option_resolver = XScreensaverConfigOptionResolver(xscreensaver_config, xscreensaver_user_config)
+        is_enabled = xscreensaver_user_config.get('enabled') if xscreensaver_user_config else False
+        name = xscreensaver_config.get('screensaver', {}).get('@_label')
+        description = xscreensaver_config.get('screensaver', {}).get('_description')
+
+        plugin_config_option_fragments = self._plugin_config_option_fragment_cache.find(xscreensaver_catalogue, item_key) if xscreensaver_catalogue is not None else None
+        if plugin_config_option_fragments is not None:
+            # Fast path, only user's values are resolved, options are built only when item is accessed as object
+            plugin_config_option_values = list(xscreensaver_config_option_resolver.get_config_option_values())
+            plugin_config_option_values.append(('is_enabled', is_enabled))
+            plugin_config_option_values.append(('is_selected', is_selected))
+            if [key for key, _ in plugin_config_option_values] == [fragment.key for fragment in plugin_config_option_fragments]:
+                return PluginConfigItem(
+                    name=name,
+                    key=item_key,
+                    description=description,
+                    is_enabled=is_enabled,
+                    is_selected=is_selected,
+                    plugin_config_option_fragments=plugin_config_option_fragments,
+                    plugin_config_option_values=[value for _, value in plugin_config_option_values],
+                    plugin_config_options_factory=lambda: self._create_plugin_config_options(xscreensaver_config_option_resolver, is_enabled, is_selected)
+                )
+
+        plugin_config_options = self._create_plugin_config_options(xscreensaver_config_option_resolver, is_enabled, is_selected)
+        return PluginConfigItem(
+            name=name,
+            key=item_key,
+            description=description,
+            plugin_config_options=plugin_config_options,
+            is_enabled=is_enabled,
+            is_selected=is_selected,
+            plugin_config_option_fragments=self._plugin_config_option_fragment_cache.get(
+                xscreensaver_catalogue,
+                item_key,
+                plugin_config_options
+            ) if xscreensaver_catalogue is not None else None
+        )
+
+    def _create_plugin_config_options(self, xscreensaver_config_option_resolver: XScreensaverConfigOptionResolver, is_enabled: bool, is_selected: bool) -> List[PluginConfigOption]:
         plugin_config_options = list(xscreensaver_config_option_resolver.get_config_options())
 
         # Common settings for each item
@@ -371,7 +664,7 @@ class Plugin(IPlugin):
             'Enabled',
             'Is this screensaver enabled?',
             Checkbox(),
-            value=xscreensaver_user_config.get('enabled') if xscreensaver_user_config else False
+            value=is_enabled
         ))
 
         plugin_config_options.append(PluginConfigOption(
@@ -382,66 +675,85 @@ class Plugin(IPlugin):
             value=is_selected
         ))
 
-        return PluginConfigItem(
-            name=xscreensaver_config.get('screensaver', {}).get('@_label'),
-            key=item_key,
-            description=xscreensaver_config.get('screensaver', {}).get('_description'),
-            plugin_config_options=plugin_config_options,
-            is_enabled=xscreensaver_user_config.get('enabled') if xscreensaver_user_config else False,
-            is_selected=is_selected
-        )
+        return plugin_config_options
 
-    def _find_xscreensaver_user_config_item(self, item_key: str, xscreensaver_user_config: dict) -> Tuple[int, Union[dict, None]]:
+    def _warm_up_plugin_config_option_fragments(self, is_cancelled: Callable[[], bool]) -> None:
+        xscreensaver_catalogue = self._get_xscreensaver_config(is_cancelled)
+        if xscreensaver_catalogue is None:
+            return
+
+        for item_key, xscreensaver_config in xscreensaver_catalogue.items():
+            if is_cancelled():
+                return
+
+            self._create_plugin_config_item(item_key, xscreensaver_config, xscreensaver_catalogue=xscreensaver_catalogue)
+
+    def _find_xscreensaver_user_config_item(self, item_key: str, xscreensaver_user_config: Mapping) -> Tuple[int, Union[dict, None]]:
         for index, program in enumerate(xscreensaver_user_config.get('programs')):
-            if program.get('command').startswith(item_key):
+            if XScreensaverProgram.belongs_to(program, item_key):
                 return index, program
 
         return 0, None
 
-    def _get_xscreensaver_config(self) -> dict:
-        config_dict = {}
-        config_dir = Path(self._xscreensaver_config_dir)
-        for xml_file in config_dir.glob('*.xml'):
-            with xml_file.open('r') as xml_handle:
-                config_dict[xml_file.stem] = xmltodict.parse(xml_handle.read(), dict_constructor=dict)
+    def _index_xscreensaver_user_config_items(self, item_keys: Iterable[str], xscreensaver_user_config: Mapping) -> dict:
+        """
+        Same lookup as _find_xscreensaver_user_config_item for many keys in one pass over programs
+        :param item_keys:
+        :param xscreensaver_user_config:
+        :return: {item_key: (index, program)}
+        """
+        not_found_keys = set(item_keys)
+        found_items = {item_key: (0, None) for item_key in not_found_keys}
+        max_item_key_length = max((len(item_key) for item_key in not_found_keys), default=0)
+        for index, program in enumerate(xscreensaver_user_config.get('programs')):
+            if not not_found_keys:
+                break
+
+            # First program matching the key wins, as in _find_xscreensaver_user_config_item
+            for item_key in XScreensaverProgram.get_item_key_candidates(program, max_item_key_length):
+                if item_key in not_found_keys:
+                    found_items[item_key] = (index, program)
+                    not_found_keys.remove(item_key)
+
+        return found_items
+
+    def _get_plugin_config_value(self, key: str, default: Any = None) -> Any:
+        return (self.plugin_config or {}).get(key, default)
+
+    def _get_xscreensaver_config(self, is_cancelled: Callable[[], bool] = None) -> Union[Mapping, None]:
+        xscreensaver_catalogue = XScreensaverCatalogue(self._xscreensaver_config_dir)
+        shared_catalogue_path = self._get_plugin_config_value('SHARED_CATALOGUE_PATH')
+        if not shared_catalogue_path:
+            return self._cached_xscreensaver_catalogue.get(xscreensaver_catalogue, is_cancelled)
+
+        # Catalogue is compiled once and mapped read-only by all worker processes
+        with self._shared_xscreensaver_catalogue_lock:
+            if not self._shared_xscreensaver_catalogue:
+                self._shared_xscreensaver_catalogue = SharedXScreensaverCatalogue(shared_catalogue_path, xscreensaver_catalogue)
+
+        try:
+            mapped_xscreensaver_catalogue = self._shared_xscreensaver_catalogue.get()
+        except OSError:
+            mapped_xscreensaver_catalogue = None
 
-        return config_dict
+        if mapped_xscreensaver_catalogue is None:
+            # Shared catalogue can not be published or mapped (eg.: path is not writable), serve from process cache
+            return self._cached_xscreensaver_catalogue.get(xscreensaver_catalogue, is_cancelled)
+
+        return mapped_xscreensaver_catalogue
 
     def _to_xscreensaver_time(self, seconds: int) -> str:
-        """
-        Convert seconds to xscreensaver time
-        :param seconds:
-        :return:
-        """
-        return str(datetime.timedelta(seconds=seconds))
+        return XScreensaverTime.to_xscreensaver_time(seconds)
 
     def _from_xscreensaver_time(self, xscreensaver_time: str) -> int:
-        """
-        Convert xscreensaver time to seconds
-        :param xscreensaver_time:
-        :return:
-        """
+        return XScreensaverTime.from_xscreensaver_time(xscreensaver_time)
 
-        parts = xscreensaver_time.split(':')
-        parts_len = len(parts)
-        try:
-            if parts_len == 1:
-                s, = parts
-                return int(s)
-            elif parts_len == 2:
-                m, s = parts
-                return int(m) * 60 + int(s)
-            elif parts_len == 3:
-                h, m, s = xscreensaver_time.split(':')
-                return int(h) * 3600 + int(m) * 60 + int(s)
-            else:
-                raise ValueError('Unknown number of parts in xscreensaver time')
-        except ValueError:
-            return 0
+    def _get_xscreensaver_user_config_path(self) -> str:
+        return os.path.join(CurrentUser.get_system_user().home_directory, '.xscreensaver')
 
     def _get_xscreensaver_user_config(self) -> ConfigParser:
-        config_path = os.path.join(CurrentUser.get_system_user().home_directory, '.xscreensaver')
-        config = ConfigParser(config_path, ignore_missing_file=True)
+        config_path = self._get_xscreensaver_user_config_path()
+        config = IsolatedConfigParser(config_path, ignore_missing_file=True)
         if not os.path.isfile(config_path):
             # File not found, generate default one
             programs_list = []
@@ -499,5 +811,15 @@ class Plugin(IPlugin):
 
         return config
 
-    def _get_xscreensaver_user_config_dict(self) -> dict:
-        return self._get_xscreensaver_user_config().read()
+    def _ensure_xscreensaver_user_config(self) -> None:
+        if not os.path.isfile(self._get_xscreensaver_user_config_path()):
+            self._get_xscreensaver_user_config()
+
+    def _get_xscreensaver_user_config_dict(self) -> Mapping:
+        config_path = self._get_xscreensaver_user_config_path()
+        if not os.path.isfile(config_path):
+            # Generates default config
+            return self._get_xscreensaver_user_config().read()
+
+        # Read-only access, programs are parsed only when needed
+        return LazyXScreensaverUserConfig(config_path)
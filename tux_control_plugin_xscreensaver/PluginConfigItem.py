@@ -1,22 +1,44 @@
-from typing import List
+import json
+from typing import Any, Callable, List
 from tux_control.plugin.IPluginConfigItem import IPluginConfigItem
 from tux_control.plugin.PluginConfigOption import PluginConfigOption
 
+from tux_control_plugin_xscreensaver.PluginConfigOptionFragment import PluginConfigOptionFragment
+
 
 class PluginConfigItem(IPluginConfigItem):
     name = None
     key = None
-    plugin_config_options = None
     is_deletable = False
     is_editable = True
 
-    def __init__(self, name: str, key: str, description: str, plugin_config_options: List[PluginConfigOption] = None, is_enabled: bool = False, is_selected: bool = False):
+    def __init__(self, name: str, key: str, description: str, plugin_config_options: List[PluginConfigOption] = None, is_enabled: bool = False, is_selected: bool = False, plugin_config_option_fragments: List[PluginConfigOptionFragment] = None, plugin_config_option_values: List[Any] = None, plugin_config_options_factory: Callable[[], List[PluginConfigOption]] = None):
+        """
+        Item is either created from plugin_config_options, or (fast path) from cached fragments and matching values,
+        full options are then built by plugin_config_options_factory only when accessed
+        """
         self.name = name
         self.key = key
         self.description = description
-        self.plugin_config_options = plugin_config_options
+        self._plugin_config_options = plugin_config_options
+        self._plugin_config_options_factory = plugin_config_options_factory
         self.is_enabled = is_enabled
         self.is_selected = is_selected
+        self.plugin_config_option_fragments = plugin_config_option_fragments
+        self.plugin_config_option_values = plugin_config_option_values
+
+    @property
+    def plugin_config_options(self) -> List[PluginConfigOption]:
+        if self._plugin_config_options is None and self._plugin_config_options_factory:
+            self._plugin_config_options = self._plugin_config_options_factory()
+
+        return self._plugin_config_options
+
+    @plugin_config_options.setter
+    def plugin_config_options(self, plugin_config_options: List[PluginConfigOption]) -> None:
+        self._plugin_config_options = plugin_config_options
+        # Values are read from options from now on
+        self.plugin_config_option_values = None
 
     @staticmethod
     def from_dict(data: dict) -> 'PluginConfigItem':
@@ -47,14 +69,52 @@ class PluginConfigItem(IPluginConfigItem):
         )
 
     def to_dict(self) -> dict:
+        if self._has_fragments():
+            # Fast path, static option metadata is already serialized
+            plugin_config_options = [
+                fragment.to_dict(value)
+                for fragment, value in zip(self.plugin_config_option_fragments, self._get_plugin_config_option_values())
+            ]
+        else:
+            plugin_config_options = self.plugin_config_options
+
+        return self._get_item_dict(plugin_config_options)
+
+    def _get_item_dict(self, plugin_config_options: Any) -> dict:
         return {
             'name': self.name,
             'key': self.key,
             'description': self.description,
             'is_deletable': self.is_deletable,
             'is_editable': self.is_editable,
-            'plugin_config_options': self.plugin_config_options,
+            'plugin_config_options': plugin_config_options,
             'is_enabled': self.is_enabled,
             'is_selected': self.is_selected
         }
 
+    def to_json(self) -> bytes:
+        if not self._has_fragments():
+            return json.dumps(PluginConfigOptionFragment.to_plain(self.to_dict()), separators=(',', ':')).encode('UTF-8')
+
+        # Item members are serialized one by one, options are joined from pre-serialized fragments
+        members = []
+        for key, value in self._get_item_dict(None).items():
+            if key == 'plugin_config_options':
+                value_json = '[{}]'.format(','.join(
+                    fragment.to_json(option_value)
+                    for fragment, option_value in zip(self.plugin_config_option_fragments, self._get_plugin_config_option_values())
+                ))
+            else:
+                value_json = json.dumps(PluginConfigOptionFragment.to_plain(value), separators=(',', ':'))
+            members.append('{}:{}'.format(json.dumps(key), value_json))
+
+        return '{{{}}}'.format(','.join(members)).encode('UTF-8')
+
+    def _get_plugin_config_option_values(self) -> List[Any]:
+        if self.plugin_config_option_values is not None:
+            return self.plugin_config_option_values
+
+        return [plugin_config_option.value for plugin_config_option in self.plugin_config_options or []]
+
+    def _has_fragments(self) -> bool:
+        return self.plugin_config_option_fragments is not None and len(self.plugin_config_option_fragments) == len(self._get_plugin_config_option_values())
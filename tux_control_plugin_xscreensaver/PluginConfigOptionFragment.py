@@ -0,0 +1,69 @@
+import json
+from enum import Enum
+from typing import Any
+from tux_control.plugin.PluginConfigOption import PluginConfigOption
+
+
+class PluginConfigOptionFragment:
+    """
+    Serialized static part of PluginConfigOption (everything but value), value is spliced in at response time
+    """
+
+    def __init__(self, key: str, static_dict: dict, value_index: int = None):
+        """
+        :param value_index: position of value among members of static_dict, value is last when not set
+        """
+        self.key = key
+        self.static_dict = static_dict
+        if value_index is None:
+            value_index = len(static_dict)
+
+        # Value is spliced in at its original position, so payload is byte-equal to PluginConfigOption.to_dict()
+        static_items = list(static_dict.items())
+        self._items_before_value = static_items[:value_index]
+        self._items_after_value = static_items[value_index:]
+        self.json_prefix = '{{{}"value":'.format(''.join(
+            '{}:{},'.format(json.dumps(item_key), self._dumps(item_value)) for item_key, item_value in self._items_before_value
+        ))
+        self.json_suffix = '{}}}'.format(''.join(
+            ',{}:{}'.format(json.dumps(item_key), self._dumps(item_value)) for item_key, item_value in self._items_after_value
+        ))
+
+    @staticmethod
+    def from_plugin_config_option(plugin_config_option: PluginConfigOption) -> 'PluginConfigOptionFragment':
+        static_dict = PluginConfigOptionFragment.to_plain(plugin_config_option.to_dict())
+        keys = list(static_dict)
+        value_index = keys.index('value') if 'value' in static_dict else None
+        static_dict.pop('value', None)
+        return PluginConfigOptionFragment(plugin_config_option.key, static_dict, value_index)
+
+    @staticmethod
+    def _dumps(data: Any) -> str:
+        return json.dumps(data, separators=(',', ':'))
+
+    @staticmethod
+    def to_plain(data: Any) -> Any:
+        """
+        Convert object tree into JSON serializable structures
+        :param data:
+        :return:
+        """
+        if isinstance(data, dict):
+            return {key: PluginConfigOptionFragment.to_plain(value) for key, value in data.items()}
+        if isinstance(data, (list, tuple)):
+            return [PluginConfigOptionFragment.to_plain(value) for value in data]
+        if isinstance(data, Enum):
+            return data.value
+        if hasattr(data, 'to_dict'):
+            return PluginConfigOptionFragment.to_plain(data.to_dict())
+
+        return data
+
+    def to_dict(self, value: Any) -> dict:
+        data = dict(self._items_before_value)
+        data['value'] = value
+        data.update(self._items_after_value)
+        return data
+
+    def to_json(self, value: Any) -> str:
+        return '{}{}{}'.format(self.json_prefix, self._dumps(self.to_plain(value)), self.json_suffix)
@@ -0,0 +1,47 @@
+import threading
+from collections.abc import Mapping
+from typing import List, Union
+from tux_control.plugin.PluginConfigOption import PluginConfigOption
+
+from tux_control_plugin_xscreensaver.PluginConfigOptionFragment import PluginConfigOptionFragment
+
+
+class PluginConfigOptionFragmentCache:
+    """
+    Option fragments of each config item, valid for one catalogue generation.
+    Catalogue mapping is same object for whole generation, so its identity is used as generation token.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._generation = None
+        self._fragments = {}
+
+    def find(self, generation: Union[Mapping, None], item_key: str) -> Union[List[PluginConfigOptionFragment], None]:
+        """
+        Fragments of item if they were already built in this generation
+        :param generation:
+        :param item_key:
+        :return:
+        """
+        with self._lock:
+            if generation is not self._generation:
+                return None
+
+            return self._fragments.get(item_key)
+
+    def get(self, generation: Union[Mapping, None], item_key: str, plugin_config_options: List[PluginConfigOption]) -> List[PluginConfigOptionFragment]:
+        with self._lock:
+            if generation is not self._generation:
+                self._generation = generation
+                self._fragments = {}
+
+            fragments = self._fragments.get(item_key)
+
+        if fragments is None or [fragment.key for fragment in fragments] != [option.key for option in plugin_config_options]:
+            fragments = [PluginConfigOptionFragment.from_plugin_config_option(option) for option in plugin_config_options]
+            with self._lock:
+                if generation is self._generation:
+                    self._fragments[item_key] = fragments
+
+        return fragments
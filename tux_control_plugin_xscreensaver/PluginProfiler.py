@@ -0,0 +1,237 @@
+import os
+import time
+import cProfile
+import datetime
+import functools
+import itertools
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, Union
+
+
+class PluginProfiler:
+    """
+    Opt-in profiling of plugin entry points, stats of sampled or slow calls are written into directory
+    """
+    file_suffixes = ('.prof', '.tracemalloc')
+
+    def __init__(
+            self,
+            directory: str,
+            use_cprofile: bool = True,
+            use_tracemalloc: bool = False,
+            sample_every: int = 0,
+            latency_threshold: float = 0.0,
+            keep_files: int = 20
+    ):
+        self.directory = directory
+        self.use_cprofile = use_cprofile
+        self.use_tracemalloc = use_tracemalloc
+        self.sample_every = sample_every
+        self.latency_threshold = latency_threshold
+        self.keep_files = keep_files
+
+        self._call_counter = itertools.count(1)
+        # cProfile and tracemalloc are process wide, only one call is captured at a time
+        self._capture_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, profiling_config: dict = None) -> Union['PluginProfiler', None]:
+        """
+        Create profiler from PROFILING section of plugin config, returns None when profiling is disabled
+        or DIRECTORY is not set
+        :param profiling_config:
+        :return:
+        """
+        if not profiling_config or not profiling_config.get('ENABLED') or not profiling_config.get('DIRECTORY'):
+            return None
+
+        return cls(
+            directory=profiling_config.get('DIRECTORY'),
+            use_cprofile=profiling_config.get('CPROFILE', True),
+            use_tracemalloc=profiling_config.get('TRACEMALLOC', False),
+            sample_every=int(profiling_config.get('SAMPLE_EVERY') or 0),
+            latency_threshold=float(profiling_config.get('LATENCY_THRESHOLD') or 0.0),
+            keep_files=int(profiling_config.get('KEEP_FILES') or 20)
+        )
+
+    def wrap(self, name: str, func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.profile(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def wrap_iterable(self, name: str, iterable: Iterable) -> Iterator:
+        """
+        Profile lazy iterable, only time spent producing items is captured.
+        Capture lock is held only while item is produced, never while consumer holds suspended generator
+        :param name:
+        :param iterable:
+        :return:
+        """
+        capture = self._start_capture()
+        if not capture:
+            yield from iterable
+            return
+
+        iterator = iter(iterable)
+        try:
+            while True:
+                capture.resume()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    capture.pause()
+                yield item
+        finally:
+            self._finish_capture(name, capture)
+
+    @contextmanager
+    def profile(self, name: str):
+        capture = self._start_capture()
+        if not capture:
+            yield
+            return
+
+        capture.resume()
+        try:
+            yield
+        finally:
+            capture.pause()
+            self._finish_capture(name, capture)
+
+    def _start_capture(self) -> Union['_Capture', None]:
+        call_number = next(self._call_counter)
+        is_sampled = bool(self.sample_every) and call_number % self.sample_every == 0
+        if not is_sampled and not self.latency_threshold:
+            return None
+
+        return _Capture(self._capture_lock, self.use_cprofile, self.use_tracemalloc, is_sampled)
+
+    def _finish_capture(self, name: str, capture: '_Capture') -> None:
+        tracemalloc_snapshot = capture.stop()
+        if not capture.is_profiled:
+            # Call was nested in or overlapped with other capture
+            return
+
+        if not capture.is_sampled and capture.elapsed < self.latency_threshold:
+            return
+
+        file_name = '{}-{}-{}ms'.format(
+            datetime.datetime.now().strftime('%Y%m%d%H%M%S%f'),
+            name,
+            int(capture.elapsed * 1000)
+        )
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            if capture.profile:
+                capture.profile.dump_stats(os.path.join(self.directory, '{}.prof'.format(file_name)))
+            if tracemalloc_snapshot:
+                tracemalloc_snapshot.dump(os.path.join(self.directory, '{}.tracemalloc'.format(file_name)))
+
+            self._rotate()
+        except OSError:
+            # Stats are written in finally of profiled call, profiling must never fail the call itself
+            pass
+
+    def _rotate(self) -> None:
+        """
+        Keep newest keep_files captures, .prof and .tracemalloc files of one capture are counted once
+        :return:
+        """
+        captures = {}
+        for file_name in os.listdir(self.directory):
+            capture_name, suffix = os.path.splitext(file_name)
+            if suffix not in self.file_suffixes:
+                continue
+            file_path = os.path.join(self.directory, file_name)
+            try:
+                modified_at = os.path.getmtime(file_path)
+            except FileNotFoundError:
+                continue
+            captured_at, file_paths = captures.get(capture_name, (0.0, []))
+            captures[capture_name] = (max(captured_at, modified_at), file_paths + [file_path])
+
+        captures_by_age = sorted(captures.values(), key=lambda capture: capture[0])
+        for _, file_paths in captures_by_age[:max(len(captures_by_age) - self.keep_files, 0)]:
+            for file_path in file_paths:
+                try:
+                    os.unlink(file_path)
+                except FileNotFoundError:
+                    pass
+
+
+class _Capture:
+    """
+    Capture of one call, profiled in segments, each segment holds capture lock only while it runs
+    """
+    # tracemalloc is process wide, it is stopped when last capture that needed it is stopped
+    _tracemalloc_lock = threading.Lock()
+    _tracemalloc_users = 0
+    _started_tracemalloc = False
+
+    def __init__(self, capture_lock: threading.Lock, use_cprofile: bool, use_tracemalloc: bool, is_sampled: bool):
+        self.is_sampled = is_sampled
+        self.is_profiled = False
+        self.elapsed = 0.0
+        self.profile = cProfile.Profile() if use_cprofile else None
+        self._capture_lock = capture_lock
+        self._use_tracemalloc = use_tracemalloc
+        self._is_segment_profiled = False
+        self._resumed_at = None
+        if self._use_tracemalloc:
+            self._acquire_tracemalloc()
+
+    def resume(self) -> None:
+        self._resumed_at = time.perf_counter()
+        # Other call (or outer entry point in this thread) is being captured, this segment is only timed
+        self._is_segment_profiled = self._capture_lock.acquire(blocking=False)
+        if not self._is_segment_profiled:
+            return
+
+        self.is_profiled = True
+        if self.profile:
+            try:
+                self.profile.enable()
+            except ValueError:
+                # Another profiler is already active in this interpreter
+                self.profile = None
+
+    def pause(self) -> None:
+        if self._is_segment_profiled:
+            if self.profile:
+                self.profile.disable()
+            self._is_segment_profiled = False
+            self._capture_lock.release()
+        self.elapsed += time.perf_counter() - self._resumed_at
+
+    def stop(self) -> Union[tracemalloc.Snapshot, None]:
+        if not self._use_tracemalloc:
+            return None
+
+        try:
+            return tracemalloc.take_snapshot() if self.is_profiled and tracemalloc.is_tracing() else None
+        finally:
+            self._use_tracemalloc = False
+            self._release_tracemalloc()
+
+    @classmethod
+    def _acquire_tracemalloc(cls) -> None:
+        with cls._tracemalloc_lock:
+            if not cls._tracemalloc_users and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                cls._started_tracemalloc = True
+            cls._tracemalloc_users += 1
+
+    @classmethod
+    def _release_tracemalloc(cls) -> None:
+        with cls._tracemalloc_lock:
+            cls._tracemalloc_users -= 1
+            if not cls._tracemalloc_users and cls._started_tracemalloc:
+                tracemalloc.stop()
+                cls._started_tracemalloc = False
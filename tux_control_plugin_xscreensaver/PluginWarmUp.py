@@ -0,0 +1,43 @@
+import threading
+from typing import Callable, List
+
+
+class PluginWarmUp:
+    """
+    Runs cache building steps in background daemon thread, each step gets is_cancelled callable
+    """
+
+    def __init__(self, steps: List[Callable[[Callable[[], bool]], None]]):
+        self.steps = steps
+        self.error = None
+        self._cancel_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='xscreensaver-warm-up', daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Wait for warm-up to finish
+        :param timeout:
+        :return: True when warm-up is no longer running
+        """
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def _run(self) -> None:
+        for step in self.steps:
+            if self.is_cancelled():
+                return
+            try:
+                step(self.is_cancelled)
+            except Exception as e:
+                # Warm-up is best effort, requests will build what is missing
+                self.error = e
+                return
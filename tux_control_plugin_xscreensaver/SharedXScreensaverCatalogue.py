@@ -0,0 +1,154 @@
+import os
+import json
+import mmap
+import fcntl
+import struct
+import tempfile
+import threading
+from collections.abc import Mapping
+from typing import Iterator, Union
+
+from tux_control_plugin_xscreensaver.XScreensaverCatalogue import XScreensaverCatalogue
+
+
+class MappedXScreensaverCatalogue(Mapping):
+    """
+    Read-only view of published catalogue, items are decoded on first access straight from the memory map.
+    Decoded items are kept for the lifetime of this generation and shared by all requests, they must not be modified.
+
+    File layout:
+        header: magic, format version, generation, catalogue fingerprint, index size
+        index: JSON object {item_key: [offset, length]}, offsets are relative to end of index
+        blobs: compact JSON of each catalogue item
+    """
+    header = struct.Struct('<4sHQ32sI')
+    magic = b'TCXS'
+    format_version = 1
+
+    def __init__(self, mapped_file: mmap.mmap, stat_key: tuple):
+        magic, format_version, generation, fingerprint, index_size = self.header.unpack_from(mapped_file, 0)
+        if magic != self.magic or format_version != self.format_version:
+            raise ValueError('Unsupported shared catalogue format')
+
+        self.stat_key = stat_key
+        self.generation = generation
+        self.fingerprint = fingerprint.decode('ascii')
+        self._mapped_file = mapped_file
+        self._blobs_offset = self.header.size + index_size
+        self._index = json.loads(mapped_file[self.header.size:self._blobs_offset])
+        self._items = {}
+
+    @classmethod
+    def dump(cls, config_dict: dict, generation: int, fingerprint: str) -> Iterator[bytes]:
+        blobs = []
+        index = {}
+        offset = 0
+        for item_key, xscreensaver_config in config_dict.items():
+            blob = json.dumps(xscreensaver_config, separators=(',', ':')).encode('UTF-8')
+            index[item_key] = [offset, len(blob)]
+            offset += len(blob)
+            blobs.append(blob)
+
+        index_blob = json.dumps(index, separators=(',', ':')).encode('UTF-8')
+        yield cls.header.pack(cls.magic, cls.format_version, generation, fingerprint.encode('ascii'), len(index_blob))
+        yield index_blob
+        yield from blobs
+
+    def __getitem__(self, item_key: str) -> dict:
+        item = self._items.get(item_key)
+        if item is None:
+            offset, length = self._index[item_key]
+            start = self._blobs_offset + offset
+            # Concurrent first access may decode item twice, both results are equal
+            item = self._items[item_key] = json.loads(self._mapped_file[start:start + length])
+
+        return item
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+class SharedXScreensaverCatalogue:
+    """
+    Catalogue compiled once into memory-mapped file shared by all worker processes.
+    Rebuild is published by atomic rename with increased generation, so readers always map a complete file.
+    """
+
+    def __init__(self, path: str, catalogue: XScreensaverCatalogue):
+        self.path = path
+        self.catalogue = catalogue
+        self._lock = threading.Lock()
+        self._mapped = None
+
+    def get(self) -> MappedXScreensaverCatalogue:
+        """
+        Returns mapped catalogue, publishes new generation when catalogue changed
+        :return:
+        """
+        fingerprint = self.catalogue.get_fingerprint()
+        mapped = self._map()
+        if not mapped or mapped.fingerprint != fingerprint:
+            self.publish(fingerprint)
+            mapped = self._map()
+
+        return mapped
+
+    def publish(self, fingerprint: str = None) -> int:
+        """
+        Compile catalogue into shared file, only one process builds it at a time
+        :param fingerprint:
+        :return: published generation
+        """
+        fingerprint = fingerprint or self.catalogue.get_fingerprint()
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+
+        with open('{}.lock'.format(self.path), 'w') as lock_handle:
+            fcntl.flock(lock_handle, fcntl.LOCK_EX)
+
+            mapped = self._map()
+            if mapped and mapped.fingerprint == fingerprint:
+                # Other worker has published it while we were waiting for the lock
+                return mapped.generation
+
+            generation = mapped.generation + 1 if mapped else 1
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.{}.'.format(os.path.basename(self.path)))
+            try:
+                with os.fdopen(fd, 'wb') as handle:
+                    handle.writelines(MappedXScreensaverCatalogue.dump(self.catalogue.load(), generation, fingerprint))
+                os.chmod(tmp_path, 0o644)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+        return generation
+
+    def _map(self) -> Union[MappedXScreensaverCatalogue, None]:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+
+        with self._lock:
+            if self._mapped and self._mapped.stat_key == (stat.st_dev, stat.st_ino, stat.st_mtime_ns):
+                return self._mapped
+
+            try:
+                with open(self.path, 'rb') as handle:
+                    stat = os.fstat(handle.fileno())
+                    mapped_file = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except (FileNotFoundError, ValueError):
+                return None
+
+            try:
+                # Old mapping is not closed, requests still reading it will release it
+                self._mapped = MappedXScreensaverCatalogue(mapped_file, (stat.st_dev, stat.st_ino, stat.st_mtime_ns))
+            except (ValueError, struct.error):
+                mapped_file.close()
+                return None
+
+            return self._mapped
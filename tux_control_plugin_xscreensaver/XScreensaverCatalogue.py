@@ -0,0 +1,74 @@
+import os
+import time
+import hashlib
+import threading
+import xmltodict
+from pathlib import Path
+from typing import Callable, Union
+
+
+class XScreensaverCatalogue:
+    """
+    Catalogue of screensavers described by xscreensaver XML config files
+    """
+    # Fingerprint is reused while catalogue directory itself is unchanged (no file added, removed or renamed),
+    # files modified in place are noticed after this many seconds
+    fingerprint_max_age = 2.0
+
+    _fingerprints_lock = threading.Lock()
+    _fingerprints = {}
+
+    def __init__(self, config_dir: str):
+        self.config_dir = config_dir
+
+    def get_fingerprint(self) -> str:
+        """
+        Cheap fingerprint of catalogue, changes when any XML file is added, removed or modified
+        :return:
+        """
+        try:
+            stat = os.stat(self.config_dir)
+            directory_key = (stat.st_dev, stat.st_ino, stat.st_mtime_ns)
+        except FileNotFoundError:
+            directory_key = None
+
+        now = time.monotonic()
+        with self._fingerprints_lock:
+            cached = self._fingerprints.get(self.config_dir)
+
+        if cached and cached[0] == directory_key and now - cached[1] < self.fingerprint_max_age:
+            return cached[2]
+
+        fingerprint = self.compute_fingerprint()
+        with self._fingerprints_lock:
+            self._fingerprints[self.config_dir] = (directory_key, now, fingerprint)
+
+        return fingerprint
+
+    def compute_fingerprint(self) -> str:
+        """
+        Fingerprint from stat of every XML file
+        :return:
+        """
+        fingerprint = hashlib.md5()
+        for xml_file in sorted(Path(self.config_dir).glob('*.xml')):
+            stat = xml_file.stat()
+            fingerprint.update('{}:{}:{};'.format(xml_file.name, stat.st_size, stat.st_mtime_ns).encode('UTF-8'))
+
+        return fingerprint.hexdigest()
+
+    def load(self, is_cancelled: Callable[[], bool] = None) -> Union[dict, None]:
+        """
+        Parse all XML files in catalogue
+        :param is_cancelled: checked before each file, loading stops and returns None when it returns True
+        :return:
+        """
+        config_dict = {}
+        for xml_file in Path(self.config_dir).glob('*.xml'):
+            if is_cancelled and is_cancelled():
+                return None
+
+            with xml_file.open('r') as xml_handle:
+                config_dict[xml_file.stem] = xmltodict.parse(xml_handle.read(), dict_constructor=dict)
+
+        return config_dict
@@ -1,6 +1,6 @@
 import re
 import shlex
-from typing import Iterable, Union
+from typing import Any, Iterable, Tuple, Union
 from tux_control.plugin.controls.Select import Select
 from tux_control.plugin.controls.Number import Number
 from tux_control.plugin.controls.Slider import Slider
@@ -28,6 +28,15 @@ class XScreensaverConfigOptionResolver:
             'vgroup': self._resolve_vgroup,
         }
 
+        self.xscreensaver_value_handlers = {
+            'number': self._value_resolve_number,
+            'boolean': self._value_resolve_boolean,
+            'select': self._value_resolve_select,
+            'string': self._value_resolve_string,
+            'hgroup': self._value_resolve_hgroup,
+            'vgroup': self._value_resolve_vgroup,
+        }
+
         self.xscreensaver_command_handlers = {
             'number': self._cmd_resolve_number,
             'boolean': self._cmd_resolve_boolean,
@@ -42,11 +51,24 @@ class XScreensaverConfigOptionResolver:
             for resolved_control in self.resolve_xscreensaver_control(item_name, item_value):
                 yield resolved_control
 
+    def get_config_option_values(self) -> Iterable[Tuple[str, Any]]:
+        """
+        Only (key, value) of each option in same order as get_config_options, controls and validators are not built
+        :return:
+        """
+        for item_name, item_value in self.xscreensaver_config.get('screensaver', {}).items():
+            for resolved_value in self.resolve_xscreensaver_value(item_name, item_value):
+                yield resolved_value
+
     def get_command(self, values: dict) -> str:
         screensaver_section = self.xscreensaver_config.get('screensaver', {})
         command_parts = [screensaver_section.get('@name')]
 
-        for command in screensaver_section.get('command', []):
+        commands = screensaver_section.get('command', [])
+        if not isinstance(commands, list):
+            commands = [commands]
+
+        for command in commands:
             command_parts.append(command.get('@arg', ''))
 
         for item_name, item_value in self.xscreensaver_config.get('screensaver', {}).items():
@@ -197,10 +219,7 @@ class XScreensaverConfigOptionResolver:
                 step=step
             )
 
-        value = self._find_argument_value(data_item.get('@arg'))
-        value = self._parse_number(value) if value else None
-        if value:
-            value = self._invert_range(min_value, max_value, value) if data_item.get('@convert') == 'invert' else value
+        value = self._find_number_value(data_item)
 
         default_value = self._parse_number(data_item.get('@default'))
         default_value = self._invert_range(min_value, max_value, default_value) if data_item.get('@convert') == 'invert' else default_value
@@ -221,7 +240,7 @@ class XScreensaverConfigOptionResolver:
     def _resolve_string(self, data_item: dict) -> Iterable[PluginConfigOption]:
         control = Text()
 
-        value = self._find_argument_value(data_item.get('@arg'))
+        value = self._find_string_value(data_item)
         default_value = data_item.get('@default')
 
         yield PluginConfigOption(
@@ -235,16 +254,7 @@ class XScreensaverConfigOptionResolver:
         )
 
     def _resolve_boolean(self, data_item: dict) -> Iterable[PluginConfigOption]:
-
-        arg_unset = data_item.get('@arg-unset')
-        arg_set = data_item.get('@arg-set')
-
-        if arg_unset and not arg_set:
-            value = not self._find_argument_set(arg_unset)
-        elif not arg_unset and arg_set:
-            value = self._find_argument_set(arg_set)
-        else:
-            raise ValueError
+        value = self._find_boolean_value(data_item)
 
         yield PluginConfigOption(
             data_item.get('@id'),
@@ -259,17 +269,15 @@ class XScreensaverConfigOptionResolver:
     def _resolve_select(self, data_item: dict) -> Iterable[PluginConfigOption]:
         options = []
         default_value = None
-        selected_value = None
         for raw_option in data_item.get('option', []):
             options.append({
                 'label': raw_option.get('@_label'),
                 'value': raw_option.get('@id')
             })
-            arg_set = raw_option.get('@arg-set')
-            if not arg_set:
+            if not raw_option.get('@arg-set'):
                 default_value = raw_option.get('@id')
-            elif self._find_argument_set(arg_set):
-                selected_value = raw_option.get('@id')
+
+        selected_value = self._find_select_value(data_item)
 
         control = Select(options=options)
 
@@ -295,6 +303,73 @@ class XScreensaverConfigOptionResolver:
                 for vgroup_item in self.resolve_xscreensaver_control(item_name, item_value):
                     yield vgroup_item
 
+    def _find_number_value(self, data_item: dict) -> Union[int, float, None]:
+        value = self._find_argument_value(data_item.get('@arg'))
+        value = self._parse_number(value) if value else None
+        if value and data_item.get('@convert') == 'invert':
+            min_value = self._parse_number(data_item.get('@low'))
+            max_value = self._parse_number(data_item.get('@high'))
+            value = self._invert_range(min_value, max_value, value)
+
+        return value
+
+    def _find_string_value(self, data_item: dict) -> Union[str, None]:
+        return self._find_argument_value(data_item.get('@arg'))
+
+    def _find_boolean_value(self, data_item: dict) -> bool:
+        arg_unset = data_item.get('@arg-unset')
+        arg_set = data_item.get('@arg-set')
+
+        if arg_unset and not arg_set:
+            return not self._find_argument_set(arg_unset)
+        elif not arg_unset and arg_set:
+            return self._find_argument_set(arg_set)
+        else:
+            raise ValueError
+
+    def _find_select_value(self, data_item: dict) -> Union[str, None]:
+        selected_value = None
+        for raw_option in data_item.get('option', []):
+            arg_set = raw_option.get('@arg-set')
+            if arg_set and self._find_argument_set(arg_set):
+                selected_value = raw_option.get('@id')
+
+        return selected_value
+
+    def _value_resolve_number(self, data_item: dict) -> Iterable[Tuple[str, Any]]:
+        yield data_item.get('@id'), self._find_number_value(data_item)
+
+    def _value_resolve_string(self, data_item: dict) -> Iterable[Tuple[str, Any]]:
+        yield data_item.get('@id'), self._find_string_value(data_item)
+
+    def _value_resolve_boolean(self, data_item: dict) -> Iterable[Tuple[str, Any]]:
+        yield data_item.get('@id'), self._find_boolean_value(data_item)
+
+    def _value_resolve_select(self, data_item: dict) -> Iterable[Tuple[str, Any]]:
+        yield data_item.get('@id'), self._find_select_value(data_item)
+
+    def _value_resolve_hgroup(self, data_item: dict = None) -> Iterable[Tuple[str, Any]]:
+        if data_item:
+            for item_name, item_value in data_item.items():
+                for hgroup_item in self.resolve_xscreensaver_value(item_name, item_value):
+                    yield hgroup_item
+
+    def _value_resolve_vgroup(self, data_item: dict = None) -> Iterable[Tuple[str, Any]]:
+        if data_item:
+            for item_name, item_value in data_item.items():
+                for vgroup_item in self.resolve_xscreensaver_value(item_name, item_value):
+                    yield vgroup_item
+
+    def resolve_xscreensaver_value(self, name: str, data: any) -> Iterable[Tuple[str, Any]]:
+        if not isinstance(data, list):
+            data = [data]
+
+        for data_item in data:
+            found_handler = self.xscreensaver_value_handlers.get(name)
+            if found_handler:
+                for item in found_handler(data_item):
+                    yield item
+
     def resolve_xscreensaver_control(self, name: str, data: any) -> Iterable[PluginConfigOption]:
         if not isinstance(data, list):
             data = [data]
@@ -0,0 +1,67 @@
+from typing import Iterable, Tuple
+
+from tux_control_plugin_xscreensaver.XScreensaverTime import XScreensaverTime
+from tux_control_plugin_xscreensaver.XScreensaverProgram import XScreensaverProgram
+
+
+class XScreensaverPolicy:
+    """
+    Policy enforced on user's xscreensaver config, forced settings are raw xscreensaver values (eg.: lockTimeout: '0:05:00').
+    When lockTimeout is forced, lock is derived from it the same way as when it is set in plugin UI.
+    """
+
+    def __init__(self, allowed_screensavers: Iterable[str] = None, disabled_screensavers: Iterable[str] = None, forced_settings: dict = None):
+        self.allowed_screensavers = set(allowed_screensavers or [])
+        self.disabled_screensavers = set(disabled_screensavers or [])
+        self.forced_settings = {key: str(value) for key, value in (forced_settings or {}).items()}
+        if 'lockTimeout' in self.forced_settings and 'lock' not in self.forced_settings:
+            lock_timeout = XScreensaverTime.from_xscreensaver_time(self.forced_settings['lockTimeout'])
+            self.forced_settings['lock'] = 'True' if lock_timeout > 0 else 'False'
+
+    @staticmethod
+    def from_plugin_config(plugin_config: dict) -> 'XScreensaverPolicy':
+        policy_config = plugin_config.get('POLICY') or {}
+        return XScreensaverPolicy(
+            allowed_screensavers=plugin_config.get('ALLOWED_SCREENSAVERS'),
+            disabled_screensavers=policy_config.get('DISABLED_SCREENSAVERS'),
+            forced_settings=policy_config.get('FORCED_SETTINGS')
+        )
+
+    def is_allowed(self, program: dict) -> bool:
+        """
+        Whether program entry may stay enabled, program is matched to screensavers same way as in plugin UI
+        :param program:
+        :return:
+        """
+        if self.allowed_screensavers and not any(XScreensaverProgram.belongs_to(program, item_key) for item_key in self.allowed_screensavers):
+            return False
+
+        return not any(XScreensaverProgram.belongs_to(program, item_key) for item_key in self.disabled_screensavers)
+
+    def get_changes(self, xscreensaver_user_config: dict) -> Tuple[dict, dict]:
+        """
+        Compute config update needed to comply with policy
+        :param xscreensaver_user_config:
+        :return: update for ConfigParser, diff in form {key: [old, new]}
+        """
+        update_data = {}
+        diff = {}
+        for key, value in self.forced_settings.items():
+            if xscreensaver_user_config.get(key) != value:
+                update_data[key] = value
+                diff[key] = [xscreensaver_user_config.get(key), value]
+
+        programs = xscreensaver_user_config.get('programs') or []
+        new_programs_list = []
+        programs_changed = False
+        for program in programs:
+            if program.get('enabled') and not self.is_allowed(program):
+                diff['programs[{}].enabled'.format(program.get('command'))] = [True, False]
+                program = dict(program, enabled=False)
+                programs_changed = True
+            new_programs_list.append(program)
+
+        if programs_changed:
+            update_data['programs'] = new_programs_list
+
+        return update_data, diff
@@ -0,0 +1,125 @@
+import os
+import pwd
+import stat
+import time
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Tuple
+
+from tux_control_plugin_xscreensaver.IsolatedConfigParser import IsolatedConfigParser
+from tux_control_plugin_xscreensaver.XScreensaverPolicy import XScreensaverPolicy
+
+
+class XScreensaverPolicyApplier:
+    """
+    Applies policy to ~/.xscreensaver of many users in parallel, each file is read and written at most once.
+    Runs as root over directories owned by users, so config is never followed through symlink or hard link,
+    and it is replaced atomically by new file with original owner and mode.
+    """
+    config_name = '.xscreensaver'
+
+    def __init__(self, policy: XScreensaverPolicy, max_workers: int = 8):
+        self.policy = policy
+        self.max_workers = max_workers
+
+    def apply(self, home_directories: Iterable[str] = None, dry_run: bool = False) -> List[dict]:
+        """
+        Apply policy to all users with existing ~/.xscreensaver
+        :param home_directories: defaults to home directories of all system users
+        :param dry_run: only compute diffs without writing
+        :return: per user results in order of home directories
+        """
+        if home_directories is None:
+            home_directories = sorted({system_user.pw_dir for system_user in pwd.getpwall()})
+
+        config_paths = [os.path.join(home_directory, self.config_name) for home_directory in home_directories]
+        config_paths = [config_path for config_path in config_paths if self._is_regular_file(config_path)]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(lambda config_path: self.apply_to_file(config_path, dry_run), config_paths))
+
+    def apply_to_file(self, config_path: str, dry_run: bool = False) -> dict:
+        started = time.perf_counter()
+        result = {
+            'config_path': config_path,
+            'user': None,
+            'changes': {},
+            'saved': False,
+            'error': None,
+            'duration': 0.0
+        }
+        directory_fd = None
+        try:
+            directory_fd = os.open(os.path.dirname(config_path) or '.', os.O_RDONLY | os.O_DIRECTORY)
+            config_stat, config_lines = self._read_config(directory_fd, os.path.basename(config_path))
+            try:
+                result['user'] = pwd.getpwuid(config_stat.st_uid).pw_name
+            except KeyError:
+                pass
+
+            xscreensaver_user_config = IsolatedConfigParser(config_path, config_lines=config_lines)
+            update_data, result['changes'] = self.policy.get_changes(xscreensaver_user_config.read())
+            if update_data and not dry_run:
+                xscreensaver_user_config.update(update_data)
+                self._replace_config(directory_fd, os.path.basename(config_path), config_stat, xscreensaver_user_config.dumps())
+                result['saved'] = True
+        except Exception as e:
+            # One broken config must not stop the whole fleet run
+            result['error'] = str(e)
+        finally:
+            if directory_fd is not None:
+                os.close(directory_fd)
+
+        result['duration'] = time.perf_counter() - started
+        return result
+
+    def _is_regular_file(self, config_path: str) -> bool:
+        try:
+            return stat.S_ISREG(os.lstat(config_path).st_mode)
+        except OSError:
+            return False
+
+    def _read_config(self, directory_fd: int, config_name: str) -> Tuple[os.stat_result, List[str]]:
+        """
+        Read config relative to already opened home directory, symlinks and hard links are refused
+        :param directory_fd:
+        :param config_name:
+        :return: stat of config, lines of config
+        """
+        config_fd = os.open(config_name, os.O_RDONLY | os.O_NOFOLLOW | os.O_NONBLOCK, dir_fd=directory_fd)
+        with os.fdopen(config_fd, 'r') as config_handle:
+            config_stat = os.fstat(config_handle.fileno())
+            if not stat.S_ISREG(config_stat.st_mode):
+                raise ValueError('{} is not a regular file'.format(config_name))
+            if config_stat.st_nlink != 1:
+                raise ValueError('{} has more than one hard link'.format(config_name))
+
+            return config_stat, config_handle.readlines()
+
+    def _replace_config(self, directory_fd: int, config_name: str, config_stat: os.stat_result, content: str) -> None:
+        """
+        Write new config next to the old one and rename it over, rename replaces directory entry itself,
+        so it can not be redirected to other file
+        :param directory_fd:
+        :param config_name:
+        :param config_stat: owner and mode of new file are taken from it
+        :param content:
+        :return:
+        """
+        temporary_name = '.{}.{}.tmp'.format(config_name, secrets.token_hex(8))
+        temporary_fd = os.open(temporary_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_NOFOLLOW, 0o600, dir_fd=directory_fd)
+        try:
+            with os.fdopen(temporary_fd, 'w') as temporary_handle:
+                os.fchown(temporary_handle.fileno(), config_stat.st_uid, config_stat.st_gid)
+                os.fchmod(temporary_handle.fileno(), stat.S_IMODE(config_stat.st_mode))
+                temporary_handle.write(content)
+                temporary_handle.flush()
+                os.fsync(temporary_handle.fileno())
+
+            os.replace(temporary_name, config_name, src_dir_fd=directory_fd, dst_dir_fd=directory_fd)
+        except BaseException:
+            try:
+                os.unlink(temporary_name, dir_fd=directory_fd)
+            except FileNotFoundError:
+                pass
+            raise
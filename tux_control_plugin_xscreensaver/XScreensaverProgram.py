@@ -0,0 +1,30 @@
+from typing import Iterable
+
+
+class XScreensaverProgram:
+    """
+    Matching of ~/.xscreensaver program entries to catalogue items, shared by plugin UI and policy
+    """
+
+    @staticmethod
+    def belongs_to(program: dict, item_key: str) -> bool:
+        """
+        Whether program entry belongs to screensaver with item_key
+        :param program:
+        :param item_key:
+        :return:
+        """
+        return (program.get('command') or '').startswith(item_key)
+
+    @staticmethod
+    def get_item_key_candidates(program: dict, max_item_key_length: int) -> Iterable[str]:
+        """
+        Every item key program entry can belong to (by belongs_to), shortest first, so programs can be matched
+        to many items by set lookups instead of calling belongs_to for every pair
+        :param program:
+        :param max_item_key_length: length of longest item key looked up
+        :return:
+        """
+        command = program.get('command') or ''
+        for length in range(min(len(command), max_item_key_length) + 1):
+            yield command[:length]
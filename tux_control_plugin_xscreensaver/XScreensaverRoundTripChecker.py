@@ -0,0 +1,253 @@
+import sys
+import json
+import time
+import random
+import string
+import argparse
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Set, Tuple, Union
+
+from tux_control_plugin_xscreensaver.XScreensaverCatalogue import XScreensaverCatalogue
+from tux_control_plugin_xscreensaver.XScreensaverConfigOptionResolver import XScreensaverConfigOptionResolver
+
+
+class XScreensaverRoundTripChecker:
+    """
+    Checks that randomized valid values survive XScreensaverConfigOptionResolver.get_command and parsing back
+
+    Mismatches are grouped into issues by (screensaver, option, kind), issues listed in baseline file are known and
+    do not fail the check, so it can gate changes while known issues are being fixed.
+
+    Usage: python3 -m tux_control_plugin_xscreensaver.XScreensaverRoundTripChecker [config_dir] [--baseline known_issues.json]
+    Baseline is (re)generated by adding --write-baseline.
+    """
+    # Strings that shell quoting and argument parsing tend to break, sent before random ones
+    string_edge_cases = ['hello world', "it's", 'a"b', '$HOME', ';&|', '*?', '\\n', '  padded  ', '-text']
+    string_characters = string.ascii_letters + string.digits + ' \'"$;&|*?<>()[]{}#~`\\!=-'
+
+    def __init__(self, iterations: int = 20, seed: int = 0, max_workers: int = None):
+        self.iterations = iterations
+        self.seed = seed
+        self.max_workers = max_workers
+
+        self.value_generators = {
+            'number': self._generate_number,
+            'boolean': self._generate_boolean,
+            'select': self._generate_select,
+            'string': self._generate_string,
+        }
+
+    def check(self, xscreensaver_catalogue: Mapping) -> List[dict]:
+        """
+        Check all screensavers in catalogue in parallel
+        :param xscreensaver_catalogue:
+        :return: mismatches
+        """
+        items = list(xscreensaver_catalogue.items())
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(self.check_screensaver, items, chunksize=max(len(items) // 64, 1))
+            return [mismatch for mismatches in results for mismatch in mismatches]
+
+    def check_screensaver(self, item: Tuple[str, dict]) -> List[dict]:
+        item_key, xscreensaver_config = item
+        random_generator = random.Random('{}:{}'.format(self.seed, item_key))
+        screensaver_section = xscreensaver_config.get('screensaver', {})
+        controls = [
+            control
+            for item_name, item_value in screensaver_section.items()
+            for control in self._collect_controls(item_name, item_value)
+        ]
+
+        mismatches = []
+        for iteration in range(self.iterations):
+            command = None
+            values = {}
+            try:
+                for control_type, data_item in controls:
+                    values[data_item.get('@id')] = self.value_generators[control_type](data_item, random_generator, iteration)
+
+                command = XScreensaverConfigOptionResolver(xscreensaver_config).get_command(values)
+                parsed_options = XScreensaverConfigOptionResolver(xscreensaver_config, {'command': command}).get_config_options()
+                parsed_values = {
+                    option.key: option.value if option.value is not None else option.default_value
+                    for option in parsed_options
+                }
+            except Exception as e:
+                mismatches.append(self._mismatch(item_key, None, 'error', values, repr(e), command))
+                # Same error would be reported by every iteration
+                break
+
+            for option_id, value in values.items():
+                received = parsed_values.get(option_id)
+                if not self._is_equal(value, received):
+                    kind = 'missing' if received is None else 'changed'
+                    mismatches.append(self._mismatch(item_key, option_id, kind, value, received, command))
+
+        return mismatches
+
+    @staticmethod
+    def get_issue_key(mismatch: dict) -> Tuple[str, Union[str, None], str]:
+        return mismatch['screensaver'], mismatch['option'], mismatch['kind']
+
+    @staticmethod
+    def get_issue_sort_key(issue_key: Tuple[str, Union[str, None], str]) -> Tuple[str, str, str]:
+        # Option of error issues is None
+        return tuple(part or '' for part in issue_key)
+
+    def group_mismatches(self, mismatches: List[dict]) -> Dict[Tuple[str, Union[str, None], str], dict]:
+        """
+        Group mismatches into issues, one per (screensaver, option, kind)
+        :param mismatches:
+        :return: issues with count of mismatches and first mismatch as example
+        """
+        issues = OrderedDict()
+        for mismatch in mismatches:
+            issue_key = self.get_issue_key(mismatch)
+            issue = issues.get(issue_key)
+            if issue is None:
+                issue = issues[issue_key] = {'count': 0, 'example': mismatch}
+            issue['count'] += 1
+
+        return issues
+
+    @staticmethod
+    def load_baseline(baseline_path: str) -> Set[Tuple[str, Union[str, None], str]]:
+        with open(baseline_path) as baseline_handle:
+            return {
+                (known_issue['screensaver'], known_issue['option'], known_issue['kind'])
+                for known_issue in json.load(baseline_handle)
+            }
+
+    @staticmethod
+    def write_baseline(baseline_path: str, issue_keys: Iterable[Tuple[str, Union[str, None], str]]) -> None:
+        known_issues = [
+            {'screensaver': screensaver, 'option': option, 'kind': kind}
+            for screensaver, option, kind in sorted(issue_keys, key=XScreensaverRoundTripChecker.get_issue_sort_key)
+        ]
+        with open(baseline_path, 'w') as baseline_handle:
+            json.dump(known_issues, baseline_handle, indent=2)
+            baseline_handle.write('\n')
+
+    def _collect_controls(self, name: str, data: Any) -> Iterable[Tuple[str, dict]]:
+        if not isinstance(data, list):
+            data = [data]
+
+        for data_item in data:
+            if name in ('hgroup', 'vgroup'):
+                if data_item:
+                    for item_name, item_value in data_item.items():
+                        yield from self._collect_controls(item_name, item_value)
+            elif name in self.value_generators:
+                yield name, data_item
+
+    def _generate_number(self, data_item: dict, random_generator: random.Random, iteration: int) -> Union[int, float]:
+        bounds = [data_item.get('@low'), data_item.get('@high'), data_item.get('@default')]
+        decimals = max([len(bound.split('.')[1]) for bound in bounds if bound and '.' in bound] or [0])
+        low = float(data_item.get('@low'))
+        high = float(data_item.get('@high'))
+        number_type = float if decimals else int
+
+        # Bounds and zero are always checked first, then random values
+        edge_cases = [number_type(low), number_type(high)]
+        if low <= 0 <= high:
+            edge_cases.append(number_type(0))
+        if iteration < len(edge_cases):
+            return edge_cases[iteration]
+
+        if not decimals:
+            return random_generator.randint(int(low), int(high))
+
+        return round(random_generator.uniform(low, high), decimals)
+
+    def _generate_boolean(self, data_item: dict, random_generator: random.Random, iteration: int) -> bool:
+        return random_generator.random() < 0.5
+
+    def _generate_select(self, data_item: dict, random_generator: random.Random, iteration: int) -> str:
+        options = data_item.get('option', [])
+        if not isinstance(options, list):
+            options = [options]
+
+        return random_generator.choice(options).get('@id')
+
+    def _generate_string(self, data_item: dict, random_generator: random.Random, iteration: int) -> str:
+        if iteration < len(self.string_edge_cases):
+            return self.string_edge_cases[iteration]
+
+        return ''.join(random_generator.choice(self.string_characters) for _ in range(random_generator.randint(1, 12)))
+
+    def _is_equal(self, sent: Any, received: Any) -> bool:
+        if isinstance(sent, (int, float)) and not isinstance(sent, bool) and isinstance(received, (int, float)):
+            return abs(sent - received) <= 1e-9 * max(1.0, abs(sent))
+
+        return sent == received
+
+    def _mismatch(self, item_key: str, option_id: Union[str, None], kind: str, sent: Any, received: Any, command: Union[str, None]) -> dict:
+        return {
+            'screensaver': item_key,
+            'option': option_id,
+            'kind': kind,
+            'sent': sent,
+            'received': received,
+            'command': command
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check round trip of screensaver settings through command line')
+    parser.add_argument('config_dir', nargs='?', default='/usr/share/xscreensaver/config/')
+    parser.add_argument('--iterations', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--baseline', help='JSON file with known issues, only issues not listed there fail the check')
+    parser.add_argument('--write-baseline', action='store_true', help='Write all found issues into --baseline file')
+    parser.add_argument('--show-known', action='store_true', help='Print known issues too')
+    args = parser.parse_args()
+    if args.write_baseline and not args.baseline:
+        parser.error('--write-baseline requires --baseline')
+
+    started = time.perf_counter()
+    xscreensaver_catalogue = XScreensaverCatalogue(args.config_dir).load()
+    xscreensaver_round_trip_checker = XScreensaverRoundTripChecker(args.iterations, args.seed, args.workers)
+    mismatches = xscreensaver_round_trip_checker.check(xscreensaver_catalogue)
+    issues = xscreensaver_round_trip_checker.group_mismatches(mismatches)
+
+    if args.write_baseline:
+        xscreensaver_round_trip_checker.write_baseline(args.baseline, issues.keys())
+        print('{} issues written to {}'.format(len(issues), args.baseline))
+        return
+
+    known_issue_keys = xscreensaver_round_trip_checker.load_baseline(args.baseline) if args.baseline else set()
+    new_issue_keys = [issue_key for issue_key in issues if issue_key not in known_issue_keys]
+    for issue_key, issue in issues.items():
+        is_new = issue_key not in known_issue_keys
+        if not is_new and not args.show_known:
+            continue
+
+        print('{marker} {screensaver}: {option}: {kind} in {count} of {iterations} iterations, e.g. sent {sent!r}, received {received!r}, command: {command}'.format(
+            marker='NEW' if is_new else 'known',
+            count=issue['count'],
+            iterations=args.iterations,
+            **issue['example']
+        ))
+
+    # Known issues no longer found can be removed from baseline
+    fixed_issue_keys = sorted(known_issue_keys - set(issues), key=xscreensaver_round_trip_checker.get_issue_sort_key)
+    for screensaver, option, kind in fixed_issue_keys:
+        print('fixed {}: {}: {}'.format(screensaver, option, kind))
+
+    print('{} screensavers, {} mismatches in {} issues ({} new, {} known, {} fixed), {:.2f} s'.format(
+        len(xscreensaver_catalogue),
+        len(mismatches),
+        len(issues),
+        len(new_issue_keys),
+        len(issues) - len(new_issue_keys),
+        len(fixed_issue_keys),
+        time.perf_counter() - started
+    ))
+    sys.exit(1 if new_issue_keys else 0)
+
+
+if __name__ == '__main__':
+    main()
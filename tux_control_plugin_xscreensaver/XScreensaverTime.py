@@ -0,0 +1,41 @@
+import datetime
+
+
+class XScreensaverTime:
+    """
+    Conversion between seconds and time values used in ~/.xscreensaver
+    """
+
+    @staticmethod
+    def to_xscreensaver_time(seconds: int) -> str:
+        """
+        Convert seconds to xscreensaver time
+        :param seconds:
+        :return:
+        """
+        return str(datetime.timedelta(seconds=seconds))
+
+    @staticmethod
+    def from_xscreensaver_time(xscreensaver_time: str) -> int:
+        """
+        Convert xscreensaver time to seconds
+        :param xscreensaver_time:
+        :return:
+        """
+
+        parts = xscreensaver_time.split(':')
+        parts_len = len(parts)
+        try:
+            if parts_len == 1:
+                s, = parts
+                return int(s)
+            elif parts_len == 2:
+                m, s = parts
+                return int(m) * 60 + int(s)
+            elif parts_len == 3:
+                h, m, s = xscreensaver_time.split(':')
+                return int(h) * 3600 + int(m) * 60 + int(s)
+            else:
+                raise ValueError('Unknown number of parts in xscreensaver time')
+        except ValueError:
+            return 0